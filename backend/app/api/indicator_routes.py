@@ -3,7 +3,11 @@
 from fastapi import APIRouter, HTTPException
 from pydantic import BaseModel
 
-from app.services.indicator_loader import discover_indicators, list_indicator_info
+from app.services.indicator_loader import (
+    clear_indicator_cache,
+    discover_indicators,
+    list_indicator_info,
+)
 from app.services.indicators import (
     BUILTIN_INDICATORS,
     get_builtin_indicator_source,
@@ -138,6 +142,7 @@ def create_indicator_file(data: IndicatorFileCreate):
     """
     try:
         file_path = write_indicator_file(data.filename, data.content)
+        clear_indicator_cache()
         return {
             "message": "Indicator file saved successfully",
             "filename": file_path.name,
@@ -166,6 +171,7 @@ def update_indicator_file(filename: str, data: IndicatorFileCreate):
             raise ValueError("Filename mismatch between path and body")
 
         write_indicator_file(filename, data.content)
+        clear_indicator_cache()
         return {"message": "Indicator file updated successfully", "filename": filename}
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
@@ -189,6 +195,7 @@ def rename_indicator(filename: str, data: IndicatorFileRename):
     """
     try:
         new_path = rename_indicator_file(filename, data.new_filename)
+        clear_indicator_cache()
         return {
             "message": "Indicator file renamed successfully",
             "old_filename": filename,
@@ -218,6 +225,7 @@ def delete_indicator(filename: str):
     """
     try:
         delete_indicator_file(filename)
+        clear_indicator_cache()
         return {"message": "Indicator file deleted successfully", "filename": filename}
     except FileNotFoundError:
         raise HTTPException(status_code=404, detail=f"Indicator file not found: {filename}")
@@ -235,6 +243,7 @@ def reload_indicators():
     Returns:
         Success message with count of loaded indicators.
     """
+    clear_indicator_cache()
     custom_indicators = discover_indicators()
     for name, cls in custom_indicators.items():
         register_custom_indicator(name, cls)
@@ -2,10 +2,12 @@
 
 import csv
 import io
+import itertools
 import sqlite3
 from datetime import datetime
 from pathlib import Path
 
+import numpy as np
 import pandas as pd
 import yfinance as yf
 
@@ -13,6 +15,14 @@ from app.core.config import DATABASE_PATH
 from app.core.database import get_connection, initialize_database
 from app.models.schemas import StockInfo
 
+_PRICE_COLUMNS = ("open", "high", "low", "close", "volume")
+_DATE_FORMATS = ("%Y-%m-%d", "%m/%d/%Y", "%Y/%m/%d", "%d-%m-%Y")
+_INSERT_OHLCV_SQL = (
+    "INSERT OR REPLACE INTO ohlcv "
+    "(stock_id, date, open, high, low, close, volume) "
+    "VALUES (?, ?, ?, ?, ?, ?, ?)"
+)
+
 
 class DataManager:
     """Manages stock data storage and retrieval via SQLite.
@@ -162,28 +172,25 @@ class DataManager:
         Returns:
             Number of rows inserted.
         """
+        # SQLite stores NaN as NULL, which the NOT NULL price columns reject,
+        # and a NaN volume cast to int64 becomes INT64_MIN; drop those rows up
+        # front instead of failing the batch or storing a bogus volume
+        df = df.dropna(subset=["Open", "High", "Low", "Close", "Volume"])
+        dates = pd.DatetimeIndex(df.index).strftime("%Y-%m-%d")
+        rows = zip(
+            itertools.repeat(stock_id), dates,
+            df["Open"].to_numpy(dtype=np.float64).tolist(),
+            df["High"].to_numpy(dtype=np.float64).tolist(),
+            df["Low"].to_numpy(dtype=np.float64).tolist(),
+            df["Close"].to_numpy(dtype=np.float64).tolist(),
+            df["Volume"].to_numpy(dtype=np.int64).tolist(),
+        )
+
         conn = self._get_conn()
         try:
-            rows_inserted = 0
-            for date_idx, row in df.iterrows():
-                date_str = pd.Timestamp(date_idx).strftime("%Y-%m-%d")
-                try:
-                    conn.execute(
-                        "INSERT OR REPLACE INTO ohlcv "
-                        "(stock_id, date, open, high, low, close, volume) "
-                        "VALUES (?, ?, ?, ?, ?, ?, ?)",
-                        (
-                            stock_id, date_str,
-                            float(row["Open"]), float(row["High"]),
-                            float(row["Low"]), float(row["Close"]),
-                            int(row["Volume"])
-                        )
-                    )
-                    rows_inserted += 1
-                except sqlite3.IntegrityError:
-                    pass
+            conn.executemany(_INSERT_OHLCV_SQL, rows)
             conn.commit()
-            return rows_inserted
+            return len(df)
         finally:
             conn.close()
 
@@ -209,30 +216,37 @@ class DataManager:
         """
         stock_id = self.get_or_create_stock(symbol, name=name)
 
-        reader = csv.DictReader(io.StringIO(csv_content))
-        column_map = self._build_column_map(reader.fieldnames or [])
+        header = next(csv.reader(io.StringIO(csv_content)), [])
+        column_map = self._build_column_map(header)
+        price_columns = [column_map[key] for key in _PRICE_COLUMNS]
+
+        # Read only the mapped columns with a fixed schema so the C parser
+        # skips dtype inference; volume is parsed as float like the old
+        # int(float(...)) path, then truncated.
+        dtypes = {column: np.float64 for column in price_columns}
+        dtypes[column_map["date"]] = str
+        df = pd.read_csv(
+            io.StringIO(csv_content),
+            engine="c",
+            usecols=list(dtypes),
+            dtype=dtypes,
+        )
+        if df[price_columns].isna().to_numpy().any():
+            raise ValueError("CSV contains empty or non-numeric price values")
+
+        dates = self._parse_dates(df[column_map["date"]])
+        opens, highs, lows, closes = (
+            df[column_map[key]].to_numpy().tolist()
+            for key in ("open", "high", "low", "close")
+        )
+        volumes = df[column_map["volume"]].to_numpy().astype(np.int64).tolist()
+        rows = zip(itertools.repeat(stock_id), dates, opens, highs, lows, closes, volumes)
 
         conn = self._get_conn()
         try:
-            rows_inserted = 0
-            for row in reader:
-                date_str = self._parse_date(row[column_map["date"]])
-                conn.execute(
-                    "INSERT OR REPLACE INTO ohlcv "
-                    "(stock_id, date, open, high, low, close, volume) "
-                    "VALUES (?, ?, ?, ?, ?, ?, ?)",
-                    (
-                        stock_id, date_str,
-                        float(row[column_map["open"]]),
-                        float(row[column_map["high"]]),
-                        float(row[column_map["low"]]),
-                        float(row[column_map["close"]]),
-                        int(float(row[column_map["volume"]]))
-                    )
-                )
-                rows_inserted += 1
+            conn.executemany(_INSERT_OHLCV_SQL, rows)
             conn.commit()
-            return rows_inserted
+            return len(dates)
         finally:
             conn.close()
 
@@ -262,6 +276,32 @@ class DataManager:
                 )
         return mapping
 
+    def _parse_dates(self, dates: pd.Series) -> list[str]:
+        """Parse a column of dates into YYYY-MM-DD strings.
+
+        Each supported format is tried over the whole column at once; only
+        values no format matched fall back to ``_parse_date``, which raises
+        with the offending value.
+
+        Args:
+            dates: Raw date strings from the CSV.
+
+        Returns:
+            Normalized date strings in YYYY-MM-DD format.
+        """
+        stripped = dates.str.strip()
+        parsed = pd.Series(pd.NaT, index=dates.index, dtype="datetime64[ns]")
+        for fmt in _DATE_FORMATS:
+            missing = parsed.isna()
+            if not missing.any():
+                break
+            parsed[missing] = pd.to_datetime(stripped[missing], format=fmt, errors="coerce")
+
+        result = parsed.dt.strftime("%Y-%m-%d")
+        for i in np.flatnonzero(parsed.isna().to_numpy()):
+            result.iat[i] = self._parse_date(str(dates.iat[i]))
+        return result.tolist()
+
     def _parse_date(self, date_str: str) -> str:
         """Parse various date formats into YYYY-MM-DD.
 
@@ -271,7 +311,7 @@ class DataManager:
         Returns:
             Normalized date string in YYYY-MM-DD format.
         """
-        for fmt in ("%Y-%m-%d", "%m/%d/%Y", "%Y/%m/%d", "%d-%m-%Y"):
+        for fmt in _DATE_FORMATS:
             try:
                 return datetime.strptime(date_str.strip(), fmt).strftime(
                     "%Y-%m-%d"
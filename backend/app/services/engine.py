@@ -5,7 +5,10 @@ method, managing the portfolio, and collecting results.
 """
 
 import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
 
+import numpy as np
 import pandas as pd
 
 from app.services.indicators import compute_indicators
@@ -27,14 +30,18 @@ class BacktestEngine:
         strategy: The Strategy instance to simulate.
         initial_capital: Starting cash amount.
         commission_rate: Commission rate per trade.
+        max_workers: Thread count for per-symbol indicator pre-computation.
+            Defaults to the number of CPUs.
     """
 
     def __init__(self, strategy: Strategy,
                  initial_capital: float = 100_000.0,
-                 commission_rate: float = 0.001):
+                 commission_rate: float = 0.001,
+                 max_workers: int | None = None):
         self.strategy = strategy
         self.initial_capital = initial_capital
         self.commission_rate = commission_rate
+        self.max_workers = max_workers or os.cpu_count() or 1
 
     def run(self, data: dict[str, pd.DataFrame]) -> Portfolio:
         """Execute the backtest.
@@ -65,7 +72,12 @@ class BacktestEngine:
             commission_rate=self.commission_rate,
         )
 
-        symbols = list(prepared_data.keys())
+        aligned_data = self._align_to_dates(prepared_data, trading_dates)
+        symbols = list(aligned_data.keys())
+        close_arrays = {
+            symbol: df["close"].to_numpy(dtype=np.float64)
+            for symbol, df in aligned_data.items()
+        }
         self.strategy.on_start(portfolio, symbols)
 
         logger.info(
@@ -73,14 +85,14 @@ class BacktestEngine:
             self.strategy.name, len(symbols), len(trading_dates)
         )
 
-        for date in trading_dates:
+        for i, date in enumerate(trading_dates):
             date_str = date.strftime("%Y-%m-%d")
-            bar_data = self._get_bar_data(prepared_data, date)
+            bar_data = self._get_bar_data(aligned_data, i)
 
             if bar_data:
                 self.strategy.on_bar(date_str, bar_data, portfolio)
 
-            current_prices = self._get_current_prices(prepared_data, date)
+            current_prices = self._get_current_prices(close_arrays, i)
             portfolio.record_equity(date_str, current_prices)
 
         self.strategy.on_end(portfolio)
@@ -97,6 +109,10 @@ class BacktestEngine:
                       data: dict[str, pd.DataFrame]) -> dict[str, pd.DataFrame]:
         """Pre-compute indicators for each symbol's DataFrame.
 
+        Symbols are independent of each other, so with more than one symbol
+        the work is spread over a thread pool (pandas/NumPy release the GIL
+        in their vectorized kernels).
+
         Args:
             data: Raw OHLCV data per symbol.
 
@@ -104,19 +120,27 @@ class BacktestEngine:
             Dict of DataFrames with indicators added as new columns.
         """
         indicator_configs = self.strategy.indicators()
-        prepared = {}
 
+        symbols = []
         for symbol, df in data.items():
             if df.empty:
                 logger.warning("Skipping empty data for %s", symbol)
                 continue
+            symbols.append(symbol)
 
+        def prepare(symbol: str) -> pd.DataFrame:
             if indicator_configs:
-                prepared[symbol] = compute_indicators(df, indicator_configs)
-            else:
-                prepared[symbol] = df.copy()
+                return compute_indicators(data[symbol], indicator_configs)
+            return data[symbol].copy()
+
+        workers = min(self.max_workers, len(symbols))
+        if indicator_configs and workers > 1:
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                frames = list(executor.map(prepare, symbols))
+        else:
+            frames = [prepare(symbol) for symbol in symbols]
 
-        return prepared
+        return dict(zip(symbols, frames))
 
     def _get_trading_dates(self,
                            data: dict[str, pd.DataFrame]) -> pd.DatetimeIndex:
@@ -143,36 +167,44 @@ class BacktestEngine:
 
         return pd.DatetimeIndex(sorted(common_dates))
 
-    def _get_bar_data(self, data: dict[str, pd.DataFrame],
-                      date: pd.Timestamp) -> dict[str, pd.Series]:
-        """Extract the row for a specific date from each symbol's data.
+    def _align_to_dates(self, data: dict[str, pd.DataFrame],
+                        trading_dates: pd.DatetimeIndex) -> dict[str, pd.DataFrame]:
+        """Restrict each symbol's data to the common trading dates.
+
+        After alignment, row ``i`` of every DataFrame is ``trading_dates[i]``,
+        so bars can be fetched by position instead of a per-bar label lookup.
 
         Args:
             data: Prepared data dict.
-            date: The date to extract.
+            trading_dates: Sorted common trading dates.
 
         Returns:
-            Dict mapping symbol to a Series of values for that date.
+            Dict of DataFrames indexed exactly by ``trading_dates``.
         """
-        bar_data = {}
-        for symbol, df in data.items():
-            if date in df.index:
-                bar_data[symbol] = df.loc[date]
-        return bar_data
+        return {symbol: df.loc[trading_dates] for symbol, df in data.items()}
 
-    def _get_current_prices(self, data: dict[str, pd.DataFrame],
-                            date: pd.Timestamp) -> dict[str, float]:
-        """Get closing prices for all symbols on a given date.
+    def _get_bar_data(self, data: dict[str, pd.DataFrame],
+                      position: int) -> dict[str, pd.Series]:
+        """Extract the row at a given position from each symbol's data.
 
         Args:
-            data: Prepared data dict.
-            date: The target date.
+            data: Data dict aligned to the trading dates.
+            position: Index of the bar within the trading dates.
 
         Returns:
-            Dict mapping symbol to the close price on that date.
+            Dict mapping symbol to a Series of values for that bar.
         """
-        prices = {}
-        for symbol, df in data.items():
-            if date in df.index:
-                prices[symbol] = float(df.loc[date, "close"])
-        return prices
+        return {symbol: df.iloc[position] for symbol, df in data.items()}
+
+    def _get_current_prices(self, close_arrays: dict[str, np.ndarray],
+                            position: int) -> dict[str, float]:
+        """Get closing prices for all symbols at a given bar.
+
+        Args:
+            close_arrays: Close prices per symbol, aligned to the trading dates.
+            position: Index of the bar within the trading dates.
+
+        Returns:
+            Dict mapping symbol to the close price at that bar.
+        """
+        return {symbol: float(closes[position]) for symbol, closes in close_arrays.items()}
@@ -6,16 +6,26 @@ subclasses, and provides a registry for the API to use.
 
 import importlib
 import importlib.util
-import inspect
 import logging
+import threading
 from pathlib import Path
+from types import ModuleType
 
 from vici_trade_sdk import Indicator
 
-from app.services.workspace import get_indicators_dir
+from app.services.workspace import get_indicators_dir, scan_python_files
 
 logger = logging.getLogger(__name__)
 
+# Indicator classes per file, keyed by path and tagged with the
+# (st_mtime_ns, st_size) they were loaded from. Like CPython's own .pyc
+# validation, an unchanged stamp means the file can be reused without
+# re-executing it.
+_MODULE_CACHE: dict[Path, tuple[tuple[int, int], dict[str, type[Indicator]]]] = {}
+# Sync routes call discover_indicators from FastAPI's threadpool, so scans
+# that read, fill and prune the cache must not interleave.
+_MODULE_CACHE_LOCK = threading.Lock()
+
 
 def discover_indicators(directory: Path | None = None) -> dict[str, type[Indicator]]:
     """Scan user workspace for Indicator subclasses and return a registry.
@@ -33,20 +43,78 @@ def discover_indicators(directory: Path | None = None) -> dict[str, type[Indicat
         logger.warning("Indicators directory not found: %s", search_dir)
         return registry
 
-    for py_file in search_dir.glob("*.py"):
-        if py_file.name.startswith("_"):
-            continue
+    with _MODULE_CACHE_LOCK:
+        _scan_into_registry(search_dir, registry)
+
+    return registry
+
+
+def clear_indicator_cache() -> None:
+    """Forget every cached indicator module.
 
+    The next discover_indicators call re-executes every file. Call this
+    after writing, renaming or deleting indicator files, since a rewrite
+    within the same mtime tick that keeps the file size would otherwise
+    match its stale stamp.
+    """
+    with _MODULE_CACHE_LOCK:
+        _MODULE_CACHE.clear()
+
+
+def _scan_into_registry(search_dir: Path, registry: dict[str, type[Indicator]]) -> None:
+    """Load every indicator file in ``search_dir`` into ``registry``.
+
+    Files whose stamp matches ``_MODULE_CACHE`` are reused without being
+    executed again. Must be called with ``_MODULE_CACHE_LOCK`` held.
+
+    Args:
+        search_dir: Directory to scan.
+        registry: Registry to add the discovered classes to.
+    """
+    seen: set[Path] = set()
+    for entry in scan_python_files(search_dir):
+        py_file = Path(entry.path)
+        seen.add(py_file)
         try:
+            stat = entry.stat()
+            stamp = (stat.st_mtime_ns, stat.st_size)
+            cached = _MODULE_CACHE.get(py_file)
+            if cached is not None and cached[0] == stamp:
+                registry.update(cached[1])
+                continue
+
             module = _load_module_from_file(py_file)
-            for name, obj in inspect.getmembers(module, inspect.isclass):
-                if issubclass(obj, Indicator) and obj is not Indicator:
-                    registry[name] = obj
-                    logger.info("Discovered indicator: %s from %s", name, py_file.name)
+            classes = _find_indicator_classes(module)
+            for name in classes:
+                logger.info("Discovered indicator: %s from %s", name, py_file.name)
+            _MODULE_CACHE[py_file] = (stamp, classes)
+            registry.update(classes)
         except Exception as exc:
+            _MODULE_CACHE.pop(py_file, None)
             logger.error("Failed to load indicator from %s: %s", py_file.name, exc)
 
-    return registry
+    # Forget files that have been deleted or renamed since the last scan
+    for path in [p for p in _MODULE_CACHE if p.parent == search_dir and p not in seen]:
+        _MODULE_CACHE.pop(path, None)
+
+
+def _find_indicator_classes(module: ModuleType) -> dict[str, type[Indicator]]:
+    """Collect the Indicator subclasses bound in a module's namespace.
+
+    Reads the module ``__dict__`` directly rather than going through
+    ``inspect.getmembers``, which calls ``getattr`` on and sorts every name.
+    Imported subclasses count as well as ones defined in the module.
+
+    Args:
+        module: The loaded module.
+
+    Returns:
+        Dict mapping attribute name to indicator class, in namespace order.
+    """
+    return {
+        name: obj for name, obj in vars(module).items()
+        if isinstance(obj, type) and issubclass(obj, Indicator) and obj is not Indicator
+    }
 
 
 def _load_module_from_file(filepath: Path):
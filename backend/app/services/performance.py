@@ -4,8 +4,9 @@ Takes trade records and equity curve from a completed backtest and
 computes standard performance metrics (return, Sharpe, drawdown, etc.).
 """
 
+from collections import deque
+
 import numpy as np
-import pandas as pd
 
 from app.models.schemas import PerformanceMetrics
 from app.services.strategy import Portfolio, Side
@@ -34,9 +35,10 @@ def calculate_performance(portfolio: Portfolio) -> PerformanceMetrics:
     total_return = final_equity - initial_capital
     total_return_pct = (total_return / initial_capital) * 100
 
+    equity = _equity_array(equity_curve)
     annualized_return_pct = _annualized_return(equity_curve, initial_capital)
-    max_drawdown_pct = _max_drawdown(equity_curve)
-    sharpe = _sharpe_ratio(equity_curve)
+    max_drawdown_pct = _max_drawdown(equity)
+    sharpe = _sharpe_ratio(equity)
 
     trade_stats = _trade_statistics(trades)
 
@@ -94,58 +96,67 @@ def _annualized_return(equity_curve: list[dict],
     return annualized * 100
 
 
-def _max_drawdown(equity_curve: list[dict]) -> float:
-    """Calculate maximum drawdown percentage.
+def _equity_array(equity_curve: list[dict]) -> np.ndarray:
+    """Extract the equity values of an equity curve into a float array.
 
     Args:
         equity_curve: List of {date, equity} dicts.
 
     Returns:
-        Maximum drawdown as a negative percentage (e.g., -15.5).
+        1-D float64 array of equity values, in curve order.
     """
-    equities = [e["equity"] for e in equity_curve]
-    if not equities:
-        return 0.0
+    return np.fromiter(
+        (e["equity"] for e in equity_curve), dtype=np.float64, count=len(equity_curve)
+    )
+
 
-    peak = equities[0]
-    max_dd = 0.0
+def _max_drawdown(equity: np.ndarray) -> float:
+    """Calculate maximum drawdown percentage.
+
+    Args:
+        equity: Equity values over time (see ``_equity_array``).
 
-    for equity in equities:
-        if equity > peak:
-            peak = equity
-        drawdown = (equity - peak) / peak * 100 if peak > 0 else 0
-        if drawdown < max_dd:
-            max_dd = drawdown
+    Returns:
+        Maximum drawdown as a negative percentage (e.g., -15.5).
+    """
+    if equity.size == 0:
+        return 0.0
 
-    return max_dd
+    peaks = np.maximum.accumulate(equity)
+    # Drawdown is undefined while the running peak is not positive; count it as 0
+    drawdowns = np.divide(
+        (equity - peaks) * 100, peaks, out=np.zeros_like(equity), where=peaks > 0
+    )
+    return min(float(drawdowns.min()), 0.0)
 
 
-def _sharpe_ratio(equity_curve: list[dict],
+def _sharpe_ratio(equity: np.ndarray,
                   risk_free_rate: float = 0.0) -> float:
     """Calculate annualized Sharpe ratio from equity curve.
 
     Args:
-        equity_curve: List of {date, equity} dicts.
+        equity: Equity values over time (see ``_equity_array``).
         risk_free_rate: Annual risk-free rate (default 0).
 
     Returns:
-        Annualized Sharpe ratio.
+        Annualized Sharpe ratio, or 0.0 when there are fewer than two
+        daily returns or they have no variance.
     """
-    if len(equity_curve) < 2:
+    if equity.size < 3:
         return 0.0
 
-    equities = pd.Series([e["equity"] for e in equity_curve])
-    daily_returns = equities.pct_change().dropna()
+    daily_returns = np.diff(equity) / equity[:-1]
+    daily_returns = daily_returns[~np.isnan(daily_returns)]
 
-    if daily_returns.std() == 0:
+    if daily_returns.size < 2:
+        return 0.0
+    std = daily_returns.std(ddof=1)
+    if std == 0:
         return 0.0
 
     daily_rf = risk_free_rate / TRADING_DAYS_PER_YEAR
-    excess_returns = daily_returns - daily_rf
-    sharpe = (excess_returns.mean() / excess_returns.std()) * np.sqrt(
-        TRADING_DAYS_PER_YEAR
-    )
-    return float(sharpe)
+    excess_mean = daily_returns.mean() - daily_rf
+    return float(excess_mean / std * np.sqrt(TRADING_DAYS_PER_YEAR))
 
 
 def _trade_statistics(trades: list) -> dict:
@@ -159,24 +170,9 @@ def _trade_statistics(trades: list) -> dict:
     Returns:
         Dict with trade statistics.
     """
-    # Match buy/sell trades into round trips
-    open_trades: dict[str, list] = {}
-    round_trips: list[float] = []
+    round_trips = _round_trip_returns(trades)
 
-    for trade in trades:
-        if trade.side == Side.BUY:
-            if trade.symbol not in open_trades:
-                open_trades[trade.symbol] = []
-            open_trades[trade.symbol].append(trade)
-        elif trade.side == Side.SELL:
-            if trade.symbol in open_trades and open_trades[trade.symbol]:
-                buy_trade = open_trades[trade.symbol].pop(0)
-                buy_cost = buy_trade.quantity * buy_trade.price + buy_trade.commission
-                sell_revenue = trade.quantity * trade.price - trade.commission
-                pnl_pct = ((sell_revenue - buy_cost) / buy_cost) * 100
-                round_trips.append(pnl_pct)
-
-    total_trades = len(round_trips)
+    total_trades = int(round_trips.size)
     if total_trades == 0:
         return {
             "win_rate": 0, "total_trades": 0,
@@ -185,23 +181,24 @@ def _trade_statistics(trades: list) -> dict:
             "max_consecutive_wins": 0, "max_consecutive_losses": 0,
         }
 
-    winning = [r for r in round_trips if r > 0]
-    losing = [r for r in round_trips if r <= 0]
-    win_rate = (len(winning) / total_trades) * 100
+    is_win = round_trips > 0
+    winning_trades = int(is_win.sum())
+    losing_trades = total_trades - winning_trades
+    win_rate = (winning_trades / total_trades) * 100
 
-    total_gains = sum(winning) if winning else 0
-    total_losses = abs(sum(losing)) if losing else 0
+    total_gains = float(round_trips[is_win].sum())
+    total_losses = abs(float(round_trips[~is_win].sum()))
     profit_factor = (total_gains / total_losses) if total_losses > 0 else float("inf")
 
-    avg_return = sum(round_trips) / total_trades
+    avg_return = float(round_trips.mean())
 
     max_wins, max_losses = _consecutive_streaks(round_trips)
 
     return {
         "win_rate": win_rate,
         "total_trades": total_trades,
-        "winning_trades": len(winning),
-        "losing_trades": len(losing),
+        "winning_trades": winning_trades,
+        "losing_trades": losing_trades,
         "profit_factor": profit_factor,
         "avg_trade_return_pct": avg_return,
         "max_consecutive_wins": max_wins,
@@ -209,28 +206,71 @@ def _trade_statistics(trades: list) -> dict:
     }
 
 
-def _consecutive_streaks(returns: list[float]) -> tuple[int, int]:
+def _round_trip_returns(trades: list) -> np.ndarray:
+    """Match BUY and SELL trades into round trips and return their P&L.
+
+    Each SELL closes the oldest open BUY for the same symbol (FIFO); SELLs
+    with nothing open and BUYs never closed are ignored. When every trade is
+    for one symbol and they strictly alternate BUY, SELL, ... (optionally
+    ending on an open BUY), the pairs are simply consecutive trades and are
+    computed in one vectorized pass.
+
+    Args:
+        trades: List of Trade objects in execution order.
+
+    Returns:
+        Array of round-trip return percentages, in order of the closing SELL.
+    """
+    n_pairs = len(trades) // 2
+    if n_pairs and len({t.symbol for t in trades}) == 1:
+        is_buy = np.fromiter((t.side == Side.BUY for t in trades), dtype=bool, count=len(trades))
+        paired = 2 * n_pairs
+        if (is_buy[:paired:2].all() and not is_buy[1:paired:2].any()
+                and (paired == len(trades) or is_buy[-1])):
+            quantity = np.fromiter((t.quantity for t in trades[:paired]), dtype=np.float64, count=paired)
+            price = np.fromiter((t.price for t in trades[:paired]), dtype=np.float64, count=paired)
+            commission = np.fromiter((t.commission for t in trades[:paired]), dtype=np.float64, count=paired)
+            buy_cost = quantity[::2] * price[::2] + commission[::2]
+            sell_revenue = quantity[1::2] * price[1::2] - commission[1::2]
+            return (sell_revenue - buy_cost) / buy_cost * 100
+
+    open_trades: dict[str, deque] = {}
+    round_trips: list[float] = []
+
+    for trade in trades:
+        if trade.side == Side.BUY:
+            open_trades.setdefault(trade.symbol, deque()).append(trade)
+        elif trade.side == Side.SELL:
+            if open_trades.get(trade.symbol):
+                buy_trade = open_trades[trade.symbol].popleft()
+                buy_cost = buy_trade.quantity * buy_trade.price + buy_trade.commission
+                sell_revenue = trade.quantity * trade.price - trade.commission
+                pnl_pct = ((sell_revenue - buy_cost) / buy_cost) * 100
+                round_trips.append(pnl_pct)
+
+    return np.asarray(round_trips, dtype=np.float64)
+
+
+def _consecutive_streaks(returns: list[float] | np.ndarray) -> tuple[int, int]:
     """Find max consecutive wins and losses.
 
+    A return above zero is a win; anything else counts as a loss.
+
     Args:
         returns: List of round-trip return percentages.
 
     Returns:
         Tuple of (max_consecutive_wins, max_consecutive_losses).
     """
-    max_wins = 0
-    max_losses = 0
-    current_wins = 0
-    current_losses = 0
-
-    for r in returns:
-        if r > 0:
-            current_wins += 1
-            current_losses = 0
-            max_wins = max(max_wins, current_wins)
-        else:
-            current_losses += 1
-            current_wins = 0
-            max_losses = max(max_losses, current_losses)
+    wins = np.asarray(returns, dtype=np.float64) > 0
+    if wins.size == 0:
+        return 0, 0
+
+    # Run-length encode the win/loss sequence: runs start where it changes
+    starts = np.flatnonzero(np.concatenate(([True], wins[1:] != wins[:-1])))
+    lengths = np.diff(np.append(starts, wins.size))
+    run_is_win = wins[starts]
 
+    max_wins = int(lengths[run_is_win].max(initial=0))
+    max_losses = int(lengths[~run_is_win].max(initial=0))
     return max_wins, max_losses
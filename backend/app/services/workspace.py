@@ -5,11 +5,15 @@ their custom trading strategies.
 """
 
 import logging
+import os
 import shutil
 from pathlib import Path
 
 logger = logging.getLogger(__name__)
 
+# Extension of every strategy and indicator source file
+_PY_EXT = ".py"
+
 
 def get_workspace_dir() -> Path:
     """Get the user workspace directory path.
@@ -47,6 +51,63 @@ def get_reports_dir() -> Path:
     return get_workspace_dir() / "reports"
 
 
+def _check_no_traversal(filename: str, label: str = "filename") -> None:
+    """Reject filenames that could escape the workspace directory.
+
+    Args:
+        filename: The user-supplied filename.
+        label: How to refer to the filename in the error message.
+
+    Raises:
+        ValueError: If the filename contains ``..``, a path separator or a NUL.
+    """
+    # Plain substring tests are several times faster than a regex search
+    # on names this short.
+    if ".." in filename or "/" in filename or "\\" in filename or "\x00" in filename:
+        raise ValueError(f"Invalid {label}: cannot contain path traversal")
+
+
+def _check_py_extension(filename: str, label: str = "Filename") -> None:
+    """Reject filenames that are not Python source files.
+
+    Args:
+        filename: The user-supplied filename.
+        label: How to refer to the filename in the error message.
+
+    Raises:
+        ValueError: If the filename does not end with ``.py``.
+    """
+    if not filename.endswith(_PY_EXT):
+        raise ValueError(f"{label} must end with .py")
+
+
+def scan_python_files(directory: Path) -> list[os.DirEntry]:
+    """List the public Python files in a directory in a single scan.
+
+    Uses ``os.scandir`` so the name and file type of each entry come from
+    one directory read rather than a separate ``stat`` per path. Files
+    starting with ``_`` are skipped.
+
+    Args:
+        directory: Directory to scan.
+
+    Returns:
+        Directory entries for the matching files, sorted by name. Empty if
+        the directory does not exist.
+    """
+    try:
+        with os.scandir(directory) as entries:
+            files = [
+                entry for entry in entries
+                if entry.name.endswith(_PY_EXT)
+                and not entry.name.startswith("_")
+                and entry.is_file()
+            ]
+    except FileNotFoundError:
+        return []
+    return sorted(files, key=lambda entry: entry.name)
+
+
 def ensure_workspace_exists() -> None:
     """Create the workspace directory structure if it doesn't exist.
 
@@ -89,8 +150,7 @@ def initialize_workspace_with_examples(builtin_strategies_dir: Path) -> None:
     strategies_dir = get_strategies_dir()
 
     # Check if workspace already has strategies
-    existing_files = list(strategies_dir.glob("*.py"))
-    if existing_files:
+    if scan_python_files(strategies_dir):
         logger.info("User workspace already has strategies, skipping initialization")
         return
 
@@ -100,14 +160,11 @@ def initialize_workspace_with_examples(builtin_strategies_dir: Path) -> None:
         return
 
     copied_count = 0
-    for py_file in builtin_strategies_dir.glob("*.py"):
-        if py_file.name.startswith("_"):
-            continue
-
-        dest = strategies_dir / py_file.name
-        shutil.copy2(py_file, dest)
+    for entry in scan_python_files(builtin_strategies_dir):
+        # copyfile moves the bytes in-kernel where the OS supports it
+        shutil.copyfile(entry.path, strategies_dir / entry.name)
         copied_count += 1
-        logger.info("Copied example strategy: %s", py_file.name)
+        logger.info("Copied example strategy: %s", entry.name)
 
     logger.info("Initialized workspace with %d example strategies", copied_count)
 
@@ -118,14 +175,7 @@ def list_strategy_files() -> list[Path]:
     Returns:
         List of Path objects for .py files in the strategies directory.
     """
-    strategies_dir = get_strategies_dir()
-    if not strategies_dir.exists():
-        return []
-
-    return sorted(
-        path for path in strategies_dir.glob("*.py")
-        if not path.name.startswith("_")
-    )
+    return [Path(entry.path) for entry in scan_python_files(get_strategies_dir())]
 
 
 def read_strategy_file(filename: str) -> str:
@@ -141,8 +191,7 @@ def read_strategy_file(filename: str) -> str:
         FileNotFoundError: If the file doesn't exist.
         ValueError: If filename tries to escape the strategies directory.
     """
-    if ".." in filename or "/" in filename or "\\" in filename:
-        raise ValueError("Invalid filename: cannot contain path traversal")
+    _check_no_traversal(filename)
 
     file_path = get_strategies_dir() / filename
     if not file_path.exists():
@@ -164,11 +213,8 @@ def write_strategy_file(filename: str, content: str) -> Path:
     Raises:
         ValueError: If filename is invalid or doesn't end with .py.
     """
-    if not filename.endswith(".py"):
-        raise ValueError("Filename must end with .py")
-
-    if ".." in filename or "/" in filename or "\\" in filename:
-        raise ValueError("Invalid filename: cannot contain path traversal")
+    _check_py_extension(filename)
+    _check_no_traversal(filename)
 
     ensure_workspace_exists()
     file_path = get_strategies_dir() / filename
@@ -188,8 +234,7 @@ def delete_strategy_file(filename: str) -> None:
         FileNotFoundError: If the file doesn't exist.
         ValueError: If filename tries to escape the strategies directory.
     """
-    if ".." in filename or "/" in filename or "\\" in filename:
-        raise ValueError("Invalid filename: cannot contain path traversal")
+    _check_no_traversal(filename)
 
     file_path = get_strategies_dir() / filename
     if not file_path.exists():
@@ -214,30 +259,26 @@ def rename_strategy_file(old_filename: str, new_filename: str) -> Path:
         FileExistsError: If a file with the new name already exists.
         ValueError: If either filename is invalid.
     """
-    # Validate both filenames
-    if ".." in old_filename or "/" in old_filename or "\\" in old_filename:
-        raise ValueError("Invalid old filename: cannot contain path traversal")
-
-    if ".." in new_filename or "/" in new_filename or "\\" in new_filename:
-        raise ValueError("Invalid new filename: cannot contain path traversal")
-
-    if not new_filename.endswith(".py"):
-        raise ValueError("New filename must end with .py")
+    _check_no_traversal(old_filename, "old filename")
+    _check_no_traversal(new_filename, "new filename")
+    _check_py_extension(new_filename, "New filename")
 
     strategies_dir = get_strategies_dir()
     old_path = strategies_dir / old_filename
     new_path = strategies_dir / new_filename
 
-    # Check if old file exists
-    if not old_path.exists():
-        raise FileNotFoundError(f"Strategy file not found: {old_filename}")
-
-    # Check if new filename already exists
+    # rename() would silently replace an existing target, so that has to be
+    # checked up front; a missing old file is reported first, as before.
     if new_path.exists():
+        if not old_path.exists():
+            raise FileNotFoundError(f"Strategy file not found: {old_filename}")
         raise FileExistsError(f"File already exists: {new_filename}")
 
-    # Rename the file
-    old_path.rename(new_path)
+    # Otherwise a missing old file surfaces from the rename itself
+    try:
+        old_path.rename(new_path)
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Strategy file not found: {old_filename}") from None
     logger.info("Strategy file renamed: %s -> %s", old_filename, new_filename)
 
     return new_path
@@ -255,8 +296,7 @@ def get_strategy_file_path(filename: str) -> Path:
     Raises:
         ValueError: If filename tries to escape the strategies directory.
     """
-    if ".." in filename or "/" in filename or "\\" in filename:
-        raise ValueError("Invalid filename: cannot contain path traversal")
+    _check_no_traversal(filename)
 
     return get_strategies_dir() / filename
 
@@ -270,14 +310,7 @@ def list_indicator_files() -> list[Path]:
     Returns:
         List of Path objects for .py files in the indicators directory.
     """
-    indicators_dir = get_indicators_dir()
-    if not indicators_dir.exists():
-        return []
-
-    return sorted(
-        path for path in indicators_dir.glob("*.py")
-        if not path.name.startswith("_")
-    )
+    return [Path(entry.path) for entry in scan_python_files(get_indicators_dir())]
 
 
 def read_indicator_file(filename: str) -> str:
@@ -293,8 +326,7 @@ def read_indicator_file(filename: str) -> str:
         FileNotFoundError: If the file doesn't exist.
         ValueError: If filename tries to escape the indicators directory.
     """
-    if ".." in filename or "/" in filename or "\\" in filename:
-        raise ValueError("Invalid filename: cannot contain path traversal")
+    _check_no_traversal(filename)
 
     file_path = get_indicators_dir() / filename
     if not file_path.exists():
@@ -316,11 +348,8 @@ def write_indicator_file(filename: str, content: str) -> Path:
     Raises:
         ValueError: If filename is invalid or doesn't end with .py.
     """
-    if not filename.endswith(".py"):
-        raise ValueError("Filename must end with .py")
-
-    if ".." in filename or "/" in filename or "\\" in filename:
-        raise ValueError("Invalid filename: cannot contain path traversal")
+    _check_py_extension(filename)
+    _check_no_traversal(filename)
 
     ensure_indicators_dir_exists()
     file_path = get_indicators_dir() / filename
@@ -340,8 +369,7 @@ def delete_indicator_file(filename: str) -> None:
         FileNotFoundError: If the file doesn't exist.
         ValueError: If filename tries to escape the indicators directory.
     """
-    if ".." in filename or "/" in filename or "\\" in filename:
-        raise ValueError("Invalid filename: cannot contain path traversal")
+    _check_no_traversal(filename)
 
     file_path = get_indicators_dir() / filename
     if not file_path.exists():
@@ -366,30 +394,26 @@ def rename_indicator_file(old_filename: str, new_filename: str) -> Path:
         FileExistsError: If a file with the new name already exists.
         ValueError: If either filename is invalid.
     """
-    # Validate both filenames
-    if ".." in old_filename or "/" in old_filename or "\\" in old_filename:
-        raise ValueError("Invalid old filename: cannot contain path traversal")
-
-    if ".." in new_filename or "/" in new_filename or "\\" in new_filename:
-        raise ValueError("Invalid new filename: cannot contain path traversal")
-
-    if not new_filename.endswith(".py"):
-        raise ValueError("New filename must end with .py")
+    _check_no_traversal(old_filename, "old filename")
+    _check_no_traversal(new_filename, "new filename")
+    _check_py_extension(new_filename, "New filename")
 
     indicators_dir = get_indicators_dir()
     old_path = indicators_dir / old_filename
     new_path = indicators_dir / new_filename
 
-    # Check if old file exists
-    if not old_path.exists():
-        raise FileNotFoundError(f"Indicator file not found: {old_filename}")
-
-    # Check if new filename already exists
+    # rename() would silently replace an existing target, so that has to be
+    # checked up front; a missing old file is reported first, as before.
     if new_path.exists():
+        if not old_path.exists():
+            raise FileNotFoundError(f"Indicator file not found: {old_filename}")
         raise FileExistsError(f"File already exists: {new_filename}")
 
-    # Rename the file
-    old_path.rename(new_path)
+    # Otherwise a missing old file surfaces from the rename itself
+    try:
+        old_path.rename(new_path)
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Indicator file not found: {old_filename}") from None
     logger.info("Indicator file renamed: %s -> %s", old_filename, new_filename)
 
     return new_path
@@ -407,7 +431,6 @@ def get_indicator_file_path(filename: str) -> Path:
     Raises:
         ValueError: If filename tries to escape the indicators directory.
     """
-    if ".." in filename or "/" in filename or "\\" in filename:
-        raise ValueError("Invalid filename: cannot contain path traversal")
+    _check_no_traversal(filename)
 
     return get_indicators_dir() / filename
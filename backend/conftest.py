@@ -0,0 +1,21 @@
+"""Test-session settings that must be applied before ``app`` is imported.
+
+Route modules build their ``DataManager``/``BacktestService`` at import
+time, which creates the database at ``DATABASE_PATH`` straight away. Point
+it at a throwaway directory here, ahead of ``tests/conftest.py`` and every
+test module, so the suite never touches ``backend/data``.
+"""
+
+import shutil
+import tempfile
+from pathlib import Path
+
+from app.core import config as app_config
+
+_TEST_DATA_DIR = Path(tempfile.mkdtemp(prefix="vici-test-data-"))
+app_config.DATABASE_PATH = _TEST_DATA_DIR / "backtest.db"
+
+
+def pytest_unconfigure(config):
+    """Remove the session database once the run is over."""
+    shutil.rmtree(_TEST_DATA_DIR, ignore_errors=True)
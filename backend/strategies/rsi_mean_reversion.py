@@ -19,33 +19,40 @@ class RSIMeanReversion(Strategy):
         position_size: Number of shares per trade (default 100).
     """
 
+    def __init__(self, params: dict | None = None):
+        super().__init__(params)
+        # Params are fixed for the lifetime of a run, so resolve them once
+        period = self.params.get("rsi_period", 14)
+        self._rsi_key = f"rsi_{period}"
+        self._oversold = self.params.get("oversold", 30)
+        self._overbought = self.params.get("overbought", 70)
+        self._size = self.params.get("position_size", 100)
+        self._indicators = [
+            {"name": "rsi", "params": {"period": period}},
+        ]
+
     @property
     def name(self) -> str:
         return "RSI Mean Reversion"
 
     def indicators(self) -> list[dict]:
-        period = self.params.get("rsi_period", 14)
-        return [
-            {"name": "rsi", "params": {"period": period}},
-        ]
+        return self._indicators
 
     def on_bar(self, date: str, data: dict[str, pd.Series],
                portfolio: Portfolio) -> None:
-        period = self.params.get("rsi_period", 14)
-        oversold = self.params.get("oversold", 30)
-        overbought = self.params.get("overbought", 70)
-        size = self.params.get("position_size", 100)
-
         for symbol, bar in data.items():
-            rsi_val = bar.get(f"rsi_{period}")
+            rsi_val = bar.get(self._rsi_key)
             close = bar["close"]
 
             if pd.isna(rsi_val):
                 continue
 
-            position = portfolio.get_position(symbol)
-
-            if rsi_val < oversold and not position.is_open:
-                portfolio.buy(symbol, size, close, date)
-            elif rsi_val > overbought and position.is_open:
-                portfolio.sell(symbol, position.quantity, close, date)
+            # Only look up the position when the signal could act on it
+            if rsi_val < self._oversold:
+                position = portfolio.get_position(symbol)
+                if not position.is_open:
+                    portfolio.buy(symbol, self._size, close, date)
+            elif rsi_val > self._overbought:
+                position = portfolio.get_position(symbol)
+                if position.is_open:
+                    portfolio.sell(symbol, position.quantity, close, date)
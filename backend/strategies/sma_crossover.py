@@ -18,43 +18,42 @@ class SMACrossover(Strategy):
         position_size: Number of shares per trade (default 100).
     """
 
-    @property
-    def name(self) -> str:
-        return "SMA Crossover"
-
-    def indicators(self) -> list[dict]:
+    def __init__(self, params: dict | None = None):
+        super().__init__(params)
+        # Params are fixed for the lifetime of a run, so resolve them once
         short = self.params.get("short_period", 50)
         long = self.params.get("long_period", 200)
-        return [
+        self._short_key = f"sma_{short}"
+        self._long_key = f"sma_{long}"
+        self._size = self.params.get("position_size", 100)
+        self._indicators = [
             {"name": "sma", "params": {"period": short}},
             {"name": "sma", "params": {"period": long}},
         ]
 
+    @property
+    def name(self) -> str:
+        return "SMA Crossover"
+
+    def indicators(self) -> list[dict]:
+        return self._indicators
+
     def on_bar(self, date: str, data: dict[str, pd.Series],
                portfolio: Portfolio) -> None:
-        short = self.params.get("short_period", 50)
-        long = self.params.get("long_period", 200)
-        size = self.params.get("position_size", 100)
-
         for symbol, bar in data.items():
-            sma_short = bar.get(f"sma_{short}")
-            sma_long = bar.get(f"sma_{long}")
+            sma_short = bar.get(self._short_key)
+            sma_long = bar.get(self._long_key)
             close = bar["close"]
 
             if pd.isna(sma_short) or pd.isna(sma_long):
                 continue
 
-            position = portfolio.get_position(symbol)
-
-            if sma_short > sma_long and not position.is_open:
-                portfolio.buy(symbol, size, close, date)
-            elif sma_short < sma_long and position.is_open:
-                portfolio.sell(symbol, position.quantity, close, date)
-
-    def on_end(self, portfolio: Portfolio) -> None:
-        """Close all open positions at the end of the backtest."""
-        for _symbol, position in portfolio.positions.items():
-            if position.is_open:
-                # We cannot get the price here directly, so we skip
-                # The engine should handle this if needed
-                pass
+            # Only look up the position when the signal could act on it
+            if sma_short > sma_long:
+                position = portfolio.get_position(symbol)
+                if not position.is_open:
+                    portfolio.buy(symbol, self._size, close, date)
+            elif sma_short < sma_long:
+                position = portfolio.get_position(symbol)
+                if position.is_open:
+                    portfolio.sell(symbol, position.quantity, close, date)
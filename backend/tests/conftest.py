@@ -1,24 +1,62 @@
 """Shared test fixtures."""
 
-import tempfile
-from pathlib import Path
-
 import numpy as np
 import pandas as pd
 import pytest
+import pytest_asyncio
+from httpx import ASGITransport, AsyncClient
 
 from app.core.database import initialize_database
+from app.main import app
 from app.services.data_manager import DataManager
 
 
+@pytest.fixture(scope="session", autouse=True)
+def workspace_home(tmp_path_factory):
+    """Point HOME at a temporary directory for the whole session.
+
+    The workspace lives under ``~/.vici-backtest``, so this keeps tests off
+    the real one. Each xdist worker gets its own base temp directory, which
+    lets the suite run in parallel without file-name collisions.
+    """
+    home = tmp_path_factory.mktemp("home")
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setenv("HOME", str(home))
+        yield home
+
+
+@pytest_asyncio.fixture(scope="session")
+async def client():
+    """Create an async HTTP client shared by every test in the session.
+
+    test_api.py overrides this with its own synchronous TestClient.
+    """
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as ac:
+        yield ac
+
+
+@pytest.fixture
+def tmp_home(monkeypatch, tmp_path):
+    """Point HOME at a fresh temporary directory for a single test.
+
+    Use this instead of ``workspace_home`` when a test writes to the
+    workspace and must not see, or leave behind, other tests' files.
+    """
+    monkeypatch.setenv("HOME", str(tmp_path))
+    return tmp_path
+
+
 @pytest.fixture
-def tmp_db_path():
-    """Create a temporary database file for testing."""
-    with tempfile.NamedTemporaryFile(suffix=".db", delete=False) as f:
-        path = Path(f.name)
+def tmp_db_path(tmp_path):
+    """Create a temporary database file for testing.
+
+    Lives under pytest's ``tmp_path`` so the database and its WAL sidecar
+    files are cleaned up with the directory.
+    """
+    path = tmp_path / "test.db"
     initialize_database(path)
-    yield path
-    path.unlink(missing_ok=True)
+    return path
 
 
 @pytest.fixture
@@ -27,31 +65,31 @@ def data_manager(tmp_db_path):
     return DataManager(tmp_db_path)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_ohlcv():
-    """Generate sample OHLCV DataFrame for testing."""
-    np.random.seed(42)
-    dates = pd.date_range("2023-01-02", periods=200, freq="B")
-    price = 100.0
-    prices = []
-    for _ in range(200):
-        price += np.random.randn() * 1.5
-        prices.append(max(price, 10))
-
-    close = np.array(prices)
+    """Generate sample OHLCV DataFrame for testing.
+
+    Built once per session and shared, so tests must treat it as read-only
+    (call ``.copy()`` before mutating).
+    """
+    rng = np.random.default_rng(42)
+    n = 200
+    dates = pd.date_range("2023-01-02", periods=n, freq="B")
+    close = np.maximum(100.0 + np.cumsum(rng.standard_normal(n) * 1.5), 10.0)
+
     return pd.DataFrame(
         {
-            "open": close * (1 + np.random.randn(200) * 0.005),
-            "high": close * (1 + np.abs(np.random.randn(200) * 0.01)),
-            "low": close * (1 - np.abs(np.random.randn(200) * 0.01)),
+            "open": close * (1 + rng.standard_normal(n) * 0.005),
+            "high": close * (1 + np.abs(rng.standard_normal(n) * 0.01)),
+            "low": close * (1 - np.abs(rng.standard_normal(n) * 0.01)),
             "close": close,
-            "volume": np.random.randint(100000, 2000000, 200),
+            "volume": rng.integers(100000, 2000000, n),
         },
         index=dates,
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_csv_content():
     """Generate sample CSV content string."""
     return (
@@ -62,3 +100,17 @@ def sample_csv_content():
         "2024-01-05,153.0,157.0,152.5,156.0,5500000\n"
         "2024-01-08,156.0,158.0,155.0,157.0,4000000\n"
     )
+
+
+@pytest.fixture(scope="module")
+def data_manager_with_sample(tmp_path_factory, sample_csv_content):
+    """DataManager with ``sample_csv_content`` imported as ``TEST``.
+
+    Imported once per module and shared, so only read-only tests should use
+    it; tests that write go through ``data_manager`` instead.
+    """
+    path = tmp_path_factory.mktemp("db") / "test.db"
+    initialize_database(path)
+    manager = DataManager(path)
+    manager.import_csv("TEST", sample_csv_content)
+    return manager
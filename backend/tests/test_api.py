@@ -14,9 +14,9 @@ def setup_workspace():
     initialize_workspace_with_examples(STRATEGIES_DIR)
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def client():
-    """Create a test client for the FastAPI app."""
+    """Create a test client for the FastAPI app, shared across the module."""
     return TestClient(app)
 
 
@@ -56,7 +56,7 @@ class TestStrategyEndpoints:
         assert response.status_code == 200
         data = response.json()
         assert isinstance(data, list)
-        class_names = [s["class_name"] for s in data]
+        class_names = {s["class_name"] for s in data}
         assert "SMACrossover" in class_names
         assert "RSIMeanReversion" in class_names
 
@@ -1,5 +1,7 @@
 """Tests for the DataManager module."""
 
+import numpy as np
+import pandas as pd
 import pytest
 
 from app.services.data_manager import DataManager
@@ -31,7 +33,7 @@ class TestStockMetadata:
         data_manager.get_or_create_stock("GOOGL", name="Alphabet Inc.")
         stocks = data_manager.list_stocks()
         assert len(stocks) == 2
-        symbols = [s.symbol for s in stocks]
+        symbols = {s.symbol for s in stocks}
         assert "AAPL" in symbols
         assert "GOOGL" in symbols
 
@@ -61,9 +63,8 @@ class TestCSVImport:
         assert info is not None
         assert info.symbol == "NEWSTOCK"
 
-    def test_import_csv_data_retrievable(self, data_manager: DataManager, sample_csv_content):
-        data_manager.import_csv("TEST", sample_csv_content)
-        df = data_manager.get_ohlcv("TEST")
+    def test_import_csv_data_retrievable(self, data_manager_with_sample: DataManager):
+        df = data_manager_with_sample.get_ohlcv("TEST")
         assert len(df) == 5
         assert list(df.columns) == ["open", "high", "low", "close", "volume"]
 
@@ -72,6 +73,53 @@ class TestCSVImport:
         with pytest.raises(ValueError, match="Missing required column"):
             data_manager.import_csv("TEST", bad_csv)
 
+    def test_import_csv_mixed_headers_and_date_formats(self, data_manager: DataManager):
+        csv_content = (
+            " Date ,Open,High,Low,Close,Adj Close,VOLUME\n"
+            "2024-01-02,1.0,2.0,0.5,1.5,1.4,5000000.0\n"
+            "01/03/2024,1.0,2.0,0.5,1.5,1.4,100\n"
+            "2024/01/04,1.0,2.0,0.5,1.5,1.4,100\n"
+            "05-01-2024,1.0,2.0,0.5,1.5,1.4,100\n"
+        )
+        assert data_manager.import_csv("TEST", csv_content) == 4
+        df = data_manager.get_ohlcv("TEST")
+        assert [d.strftime("%Y-%m-%d") for d in df.index] == [
+            "2024-01-02", "2024-01-03", "2024-01-04", "2024-01-05",
+        ]
+        assert df["volume"].iloc[0] == 5_000_000
+
+    @pytest.mark.parametrize("row", [
+        "2024-01-03,1.0,2.0,0.5,1.5,",
+        "2024-01-03,1.0,,0.5,1.5,100",
+    ])
+    def test_import_csv_rejects_missing_values(self, data_manager: DataManager, row):
+        csv_content = f"date,open,high,low,close,volume\n2024-01-02,1.0,2.0,0.5,1.5,100\n{row}\n"
+        with pytest.raises(ValueError, match="empty or non-numeric"):
+            data_manager.import_csv("TEST", csv_content)
+        assert data_manager.get_ohlcv("TEST").empty
+
+    def test_store_dataframe_skips_rows_with_missing_values(self, data_manager: DataManager):
+        df = pd.DataFrame(
+            {
+                "Open": [1.0, 1.0, 1.0, 1.0],
+                "High": [2.0, 2.0, np.nan, 2.0],
+                "Low": [0.5, 0.5, 0.5, 0.5],
+                "Close": [1.5, 1.5, 1.5, 1.5],
+                "Volume": [100.0, np.nan, 100.0, 200.0],
+            },
+            index=pd.date_range("2024-01-02", periods=4),
+        )
+        stock_id = data_manager.get_or_create_stock("TEST")
+        assert data_manager._store_dataframe(stock_id, df) == 2
+        stored = data_manager.get_ohlcv("TEST")
+        assert [d.strftime("%Y-%m-%d") for d in stored.index] == ["2024-01-02", "2024-01-05"]
+        assert stored["volume"].tolist() == [100, 200]
+
+    def test_import_csv_invalid_date(self, data_manager: DataManager):
+        bad_csv = "date,open,high,low,close,volume\nnot-a-date,1,1,1,1,1\n"
+        with pytest.raises(ValueError, match="Cannot parse date"):
+            data_manager.import_csv("TEST", bad_csv)
+
     def test_import_csv_upsert(self, data_manager: DataManager, sample_csv_content):
         data_manager.import_csv("TEST", sample_csv_content)
         data_manager.import_csv("TEST", sample_csv_content)
@@ -86,19 +134,16 @@ class TestOHLCVQuery:
         df = data_manager.get_ohlcv("NONEXISTENT")
         assert df.empty
 
-    def test_get_ohlcv_with_date_filter(self, data_manager: DataManager, sample_csv_content):
-        data_manager.import_csv("TEST", sample_csv_content)
-        df = data_manager.get_ohlcv("TEST", start_date="2024-01-03", end_date="2024-01-05")
+    def test_get_ohlcv_with_date_filter(self, data_manager_with_sample: DataManager):
+        df = data_manager_with_sample.get_ohlcv("TEST", start_date="2024-01-03", end_date="2024-01-05")
         assert len(df) == 3
 
-    def test_get_ohlcv_start_date_only(self, data_manager: DataManager, sample_csv_content):
-        data_manager.import_csv("TEST", sample_csv_content)
-        df = data_manager.get_ohlcv("TEST", start_date="2024-01-04")
+    def test_get_ohlcv_start_date_only(self, data_manager_with_sample: DataManager):
+        df = data_manager_with_sample.get_ohlcv("TEST", start_date="2024-01-04")
         assert len(df) == 3
 
-    def test_get_date_range(self, data_manager: DataManager, sample_csv_content):
-        data_manager.import_csv("TEST", sample_csv_content)
-        result = data_manager.get_date_range("TEST")
+    def test_get_date_range(self, data_manager_with_sample: DataManager):
+        result = data_manager_with_sample.get_date_range("TEST")
         assert result is not None
         assert result[0] == "2024-01-02"
         assert result[1] == "2024-01-08"
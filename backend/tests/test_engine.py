@@ -1,10 +1,12 @@
 """Tests for the Backtest Engine."""
 
+import numpy as np
 import pandas as pd
 import pytest
 
 from app.services.engine import BacktestEngine
 from app.services.strategy import Strategy
+from strategies.sma_crossover import SMACrossover
 
 
 class AlwaysBuyStrategy(Strategy):
@@ -93,6 +95,14 @@ class TestBacktestEngine:
         # Strategy only buys when close > SMA, so should have some trades
         assert len(portfolio.equity_history) > 0
 
+    def test_parallel_precompute_matches_sequential(self, sample_ohlcv):
+        data = {"STOCK_A": sample_ohlcv, "STOCK_B": sample_ohlcv * 1.1}
+        parallel = BacktestEngine(WithIndicatorStrategy(), max_workers=4)._prepare_data(data)
+        sequential = BacktestEngine(WithIndicatorStrategy(), max_workers=1)._prepare_data(data)
+        assert list(parallel) == ["STOCK_A", "STOCK_B"]
+        for symbol in data:
+            pd.testing.assert_frame_equal(parallel[symbol], sequential[symbol])
+
     def test_multi_stock(self, sample_ohlcv):
         # Use same data for two symbols
         engine = BacktestEngine(AlwaysBuyStrategy(), initial_capital=200_000)
@@ -123,3 +133,47 @@ class TestBacktestEngine:
         portfolio = engine.run({"TEST": sample_ohlcv})
         assert portfolio.equity_history[-1]["equity"] == 50_000
         assert len(portfolio.trades) == 0
+
+
+def _flat_bars(close):
+    """OHLCV frame whose every price column is ``close``."""
+    dates = pd.date_range("2024-01-01", periods=len(close), freq="B")
+    return pd.DataFrame(
+        {"open": close, "high": close, "low": close, "close": close, "volume": 1000},
+        index=dates,
+    )
+
+
+class TestSMACrossoverTies:
+    """Equal fast and slow SMAs must stay equal, or the crossover trades on noise."""
+
+    PARAMS = {"short_period": 5, "long_period": 20, "position_size": 10}
+
+    def test_constant_prices_never_trade(self):
+        engine = BacktestEngine(SMACrossover(self.PARAMS), initial_capital=100_000)
+        portfolio = engine.run({"TEST": _flat_bars(np.full(120, 100.37))})
+        assert portfolio.trades == []
+        assert portfolio.equity_history[-1]["equity"] == 100_000
+
+    def test_tick_quantized_prices_match_rolling_mean_signals(self):
+        rng = np.random.default_rng(1)
+        close = np.round(100 + np.cumsum(rng.choice([-0.1, 0.0, 0.1], size=120)), 1)
+        bars = _flat_bars(close)
+
+        # Reference signals straight from rolling().mean(), the baseline behaviour
+        fast = bars["close"].rolling(5).mean()
+        slow = bars["close"].rolling(20).mean()
+        expected, holding = [], False
+        for date, f, s in zip(bars.index, fast, slow):
+            if pd.isna(f) or pd.isna(s):
+                continue
+            if f > s and not holding:
+                expected.append((date.strftime("%Y-%m-%d"), "BUY"))
+                holding = True
+            elif f < s and holding:
+                expected.append((date.strftime("%Y-%m-%d"), "SELL"))
+                holding = False
+
+        engine = BacktestEngine(SMACrossover(self.PARAMS), initial_capital=100_000)
+        portfolio = engine.run({"TEST": bars})
+        assert [(t.date, t.side.value) for t in portfolio.trades] == expected
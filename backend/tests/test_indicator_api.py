@@ -1,34 +1,15 @@
 """Tests for indicator API endpoints."""
 
-import shutil
+import os
 
 import pytest
-from httpx import ASGITransport, AsyncClient
+from httpx import AsyncClient
 
-from app.main import app
+from app.services import indicator_loader
 from app.services.workspace import get_indicators_dir, write_indicator_file
 
 
-@pytest.fixture
-def clean_indicators_workspace():
-    """Clean up indicator workspace before and after tests."""
-    indicators_dir = get_indicators_dir()
-    if indicators_dir.exists():
-        shutil.rmtree(indicators_dir)
-    yield
-    if indicators_dir.exists():
-        shutil.rmtree(indicators_dir)
-
-
-@pytest.fixture
-async def client():
-    """Create an async HTTP client for testing."""
-    transport = ASGITransport(app=app)
-    async with AsyncClient(transport=transport, base_url="http://test") as ac:
-        yield ac
-
-
-async def test_list_indicator_files(client: AsyncClient, clean_indicators_workspace):
+async def test_list_indicator_files(client: AsyncClient, tmp_home):
     """Test listing indicator files."""
     write_indicator_file("test1.py", "# indicator 1")
     write_indicator_file("test2.py", "# indicator 2")
@@ -37,13 +18,13 @@ async def test_list_indicator_files(client: AsyncClient, clean_indicators_worksp
     assert response.status_code == 200
 
     files = response.json()
-    filenames = [f["filename"] for f in files]
+    filenames = {f["filename"] for f in files}
 
     assert "test1.py" in filenames
     assert "test2.py" in filenames
 
 
-async def test_get_indicator_file(client: AsyncClient, clean_indicators_workspace):
+async def test_get_indicator_file(client: AsyncClient, tmp_home):
     """Test getting a specific indicator file."""
     content = "from vici_trade_sdk import Indicator\n\nclass Test(Indicator):\n    pass"
     write_indicator_file("test.py", content)
@@ -56,13 +37,13 @@ async def test_get_indicator_file(client: AsyncClient, clean_indicators_workspac
     assert data["content"] == content
 
 
-async def test_get_nonexistent_file(client: AsyncClient, clean_indicators_workspace):
+async def test_get_nonexistent_file(client: AsyncClient, tmp_home):
     """Test getting a file that doesn't exist returns 404."""
     response = await client.get("/api/indicators/files/nonexistent.py")
     assert response.status_code == 404
 
 
-async def test_create_indicator_file(client: AsyncClient, clean_indicators_workspace):
+async def test_create_indicator_file(client: AsyncClient, tmp_home):
     """Test creating a new indicator file."""
     content = "from vici_trade_sdk import Indicator"
     payload = {"filename": "new.py", "content": content}
@@ -79,7 +60,7 @@ async def test_create_indicator_file(client: AsyncClient, clean_indicators_works
     assert (indicators_dir / "new.py").exists()
 
 
-async def test_create_invalid_filename(client: AsyncClient, clean_indicators_workspace):
+async def test_create_invalid_filename(client: AsyncClient, tmp_home):
     """Test creating a file with invalid extension returns 400."""
     payload = {"filename": "invalid.txt", "content": "# content"}
 
@@ -87,7 +68,7 @@ async def test_create_invalid_filename(client: AsyncClient, clean_indicators_wor
     assert response.status_code == 400
 
 
-async def test_update_indicator_file(client: AsyncClient, clean_indicators_workspace):
+async def test_update_indicator_file(client: AsyncClient, tmp_home):
     """Test updating an existing indicator file."""
     write_indicator_file("update.py", "# old content")
 
@@ -102,7 +83,7 @@ async def test_update_indicator_file(client: AsyncClient, clean_indicators_works
     assert (indicators_dir / "update.py").read_text() == new_content
 
 
-async def test_delete_indicator_file(client: AsyncClient, clean_indicators_workspace):
+async def test_delete_indicator_file(client: AsyncClient, tmp_home):
     """Test deleting an indicator file."""
     write_indicator_file("delete.py", "# content")
     indicators_dir = get_indicators_dir()
@@ -115,13 +96,13 @@ async def test_delete_indicator_file(client: AsyncClient, clean_indicators_works
     assert not (indicators_dir / "delete.py").exists()
 
 
-async def test_delete_nonexistent_file(client: AsyncClient, clean_indicators_workspace):
+async def test_delete_nonexistent_file(client: AsyncClient, tmp_home):
     """Test deleting a non-existent file returns 404."""
     response = await client.delete("/api/indicators/files/nonexistent.py")
     assert response.status_code == 404
 
 
-async def test_rename_indicator_file(client: AsyncClient, clean_indicators_workspace):
+async def test_rename_indicator_file(client: AsyncClient, tmp_home):
     """Test renaming an indicator file."""
     write_indicator_file("old.py", "# content")
 
@@ -139,39 +120,24 @@ async def test_rename_indicator_file(client: AsyncClient, clean_indicators_works
     assert (indicators_dir / "new.py").exists()
 
 
-async def test_rename_nonexistent_file(client: AsyncClient, clean_indicators_workspace):
-    """Test renaming a non-existent file returns 404."""
-    payload = {"new_filename": "new.py"}
-    response = await client.post("/api/indicators/files/nonexistent.py/rename", json=payload)
-    assert response.status_code == 404
-
+@pytest.mark.parametrize(
+    ("existing", "old_filename", "new_filename", "expected_status"),
+    [
+        pytest.param([], "nonexistent.py", "new.py", 404, id="nonexistent"),
+        pytest.param(["old.py", "new.py"], "old.py", "new.py", 409, id="existing-target"),
+        pytest.param(["test.py"], "test.py", "test.txt", 400, id="invalid-extension"),
+        pytest.param(["test.py"], "test.py", "../evil.py", 400, id="path-traversal"),
+    ],
+)
+async def test_rename_error_cases(client: AsyncClient, tmp_home,
+                                  existing, old_filename, new_filename, expected_status):
+    """Test that invalid renames are rejected with the right status code."""
+    for filename in existing:
+        write_indicator_file(filename, f"# {filename}")
 
-async def test_rename_to_existing_file(client: AsyncClient, clean_indicators_workspace):
-    """Test renaming to an existing filename returns 409."""
-    write_indicator_file("old.py", "# old")
-    write_indicator_file("new.py", "# new")
-
-    payload = {"new_filename": "new.py"}
-    response = await client.post("/api/indicators/files/old.py/rename", json=payload)
-    assert response.status_code == 409
-
-
-async def test_rename_invalid_extension(client: AsyncClient, clean_indicators_workspace):
-    """Test renaming to invalid extension returns 400."""
-    write_indicator_file("test.py", "# content")
-
-    payload = {"new_filename": "test.txt"}
-    response = await client.post("/api/indicators/files/test.py/rename", json=payload)
-    assert response.status_code == 400
-
-
-async def test_rename_path_traversal(client: AsyncClient, clean_indicators_workspace):
-    """Test that path traversal in rename is blocked."""
-    write_indicator_file("test.py", "# content")
-
-    payload = {"new_filename": "../evil.py"}
-    response = await client.post("/api/indicators/files/test.py/rename", json=payload)
-    assert response.status_code == 400
+    payload = {"new_filename": new_filename}
+    response = await client.post(f"/api/indicators/files/{old_filename}/rename", json=payload)
+    assert response.status_code == expected_status
 
 
 async def test_list_indicators_includes_builtin(client: AsyncClient):
@@ -180,7 +146,7 @@ async def test_list_indicators_includes_builtin(client: AsyncClient):
     assert response.status_code == 200
 
     indicators = response.json()
-    indicator_names = [ind["name"] for ind in indicators]
+    indicator_names = {ind["name"] for ind in indicators}
 
     # Check for some built-in indicators
     assert "sma" in indicator_names
@@ -188,7 +154,7 @@ async def test_list_indicators_includes_builtin(client: AsyncClient):
     assert "rsi" in indicator_names
 
 
-async def test_list_indicators_includes_custom(client: AsyncClient, clean_indicators_workspace):
+async def test_list_indicators_includes_custom(client: AsyncClient, tmp_home):
     """Test that listing indicators includes custom indicators."""
     # Create a custom indicator
     indicator_code = """from vici_trade_sdk import Indicator
@@ -217,7 +183,7 @@ class TestIndicator(Indicator):
     assert any(ind["name"] == "test_custom" for ind in custom_indicators)
 
 
-async def test_reload_indicators(client: AsyncClient, clean_indicators_workspace):
+async def test_reload_indicators(client: AsyncClient, tmp_home):
     """Test reloading indicators from workspace."""
     # Create a new indicator
     indicator_code = """from vici_trade_sdk import Indicator
@@ -239,3 +205,52 @@ class NewIndicator(Indicator):
     data = response.json()
     assert "count" in data
     assert data["count"] >= 1
+
+
+_SAME_SIZE_INDICATOR = """from vici_trade_sdk import Indicator
+
+class SameSize(Indicator):
+    @property
+    def name(self) -> str:
+        return "version_1"
+
+    def compute(self, df):
+        return df["close"]
+"""
+
+
+async def test_reload_clears_indicator_cache(client: AsyncClient, tmp_home):
+    """Test that reload re-executes files whose stamp did not change."""
+    path = write_indicator_file("same.py", _SAME_SIZE_INDICATOR)
+    await client.post("/api/indicators/reload")
+
+    # Same size, same mtime: only clearing the cache picks the edit up
+    stat = path.stat()
+    path.write_text(_SAME_SIZE_INDICATOR.replace("version_1", "version_2"))
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+
+    response = await client.post("/api/indicators/reload")
+    assert response.status_code == 200
+
+    response = await client.get("/api/indicators")
+    names = {ind["name"] for ind in response.json() if ind["type"] == "custom"}
+    assert names == {"version_2"}
+
+
+@pytest.mark.parametrize("method,url,payload", [
+    ("post", "/api/indicators/files", {"filename": "new.py", "content": "# new"}),
+    ("put", "/api/indicators/files/same.py", {"filename": "same.py", "content": "# edited"}),
+    ("post", "/api/indicators/files/same.py/rename", {"new_filename": "renamed.py"}),
+    ("delete", "/api/indicators/files/same.py", None),
+])
+async def test_file_changes_clear_indicator_cache(client: AsyncClient, tmp_home,
+                                                  method, url, payload):
+    """Test that writing, renaming or deleting a file clears the module cache."""
+    write_indicator_file("same.py", _SAME_SIZE_INDICATOR)
+    indicator_loader.discover_indicators()
+    assert indicator_loader._MODULE_CACHE
+
+    kwargs = {} if payload is None else {"json": payload}
+    response = await client.request(method.upper(), url, **kwargs)
+    assert response.status_code == 200
+    assert not indicator_loader._MODULE_CACHE
@@ -1,16 +1,154 @@
 """Tests for indicator loading from user workspace."""
 
+import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
 from textwrap import dedent
 
 import pytest
 from vici_trade_sdk import Indicator
 
 from app.services.indicator_loader import (
+    clear_indicator_cache,
     discover_indicators,
     get_indicator_class,
     list_indicator_info,
 )
 
+# Indicator sources are dedented once at import time and shared by the tests
+_WILLIAMS_R_SRC = dedent('''
+    from vici_trade_sdk import Indicator
+    import pandas as pd
+
+    class WilliamsR(Indicator):
+        def __init__(self, period: int = 14):
+            self.period = period
+
+        @property
+        def name(self) -> str:
+            return f"williams_r_{self.period}"
+
+        def compute(self, df: pd.DataFrame) -> pd.Series:
+            return pd.Series([0] * len(df), index=df.index)
+    ''')
+
+_TWO_INDICATORS_SRC = dedent('''
+    from vici_trade_sdk import Indicator
+    import pandas as pd
+
+    class IndicatorOne(Indicator):
+        @property
+        def name(self) -> str:
+            return "indicator_one"
+
+        def compute(self, df: pd.DataFrame) -> pd.Series:
+            return df["close"]
+
+    class IndicatorTwo(Indicator):
+        @property
+        def name(self) -> str:
+            return "indicator_two"
+
+        def compute(self, df: pd.DataFrame) -> pd.Series:
+            return df["close"]
+    ''')
+
+_MY_INDICATOR_SRC = dedent('''
+    from vici_trade_sdk import Indicator
+    import pandas as pd
+
+    class MyIndicator(Indicator):
+        @property
+        def name(self) -> str:
+            return "my_indicator"
+
+        def compute(self, df: pd.DataFrame) -> pd.Series:
+            return df["close"]
+    ''')
+
+_PRIVATE_INDICATOR_SRC = dedent('''
+    from vici_trade_sdk import Indicator
+    import pandas as pd
+
+    class PrivateIndicator(Indicator):
+        @property
+        def name(self) -> str:
+            return "private"
+
+        def compute(self, df: pd.DataFrame) -> pd.Series:
+            return df["close"]
+    ''')
+
+_CACHED_SRC = dedent('''
+    from vici_trade_sdk import Indicator
+
+    class Cached(Indicator):
+        @property
+        def name(self) -> str:
+            return "cached"
+
+        def compute(self, df):
+            return df["close"]
+    ''')
+
+_GONE_SRC = dedent('''
+    from vici_trade_sdk import Indicator
+
+    class Gone(Indicator):
+        @property
+        def name(self) -> str:
+            return "gone"
+
+        def compute(self, df):
+            return df["close"]
+    ''')
+
+_TEST_INDICATOR_SRC = dedent('''
+    from vici_trade_sdk import Indicator
+    import pandas as pd
+
+    class TestIndicator(Indicator):
+        @property
+        def name(self) -> str:
+            return "test"
+
+        def compute(self, df: pd.DataFrame) -> pd.Series:
+            return df["close"]
+    ''')
+
+_DOCUMENTED_INDICATOR_SRC = dedent('''
+    from vici_trade_sdk import Indicator
+    import pandas as pd
+
+    class DocumentedIndicator(Indicator):
+        """This is a well-documented indicator."""
+
+        @property
+        def name(self) -> str:
+            return "documented"
+
+        def compute(self, df: pd.DataFrame) -> pd.Series:
+            return df["close"]
+    ''')
+
+_REQUIRES_ARGS_SRC = dedent('''
+    from vici_trade_sdk import Indicator
+    import pandas as pd
+
+    class RequiresArgs(Indicator):
+        """Requires constructor arguments."""
+
+        def __init__(self, required_param: int):
+            self.required_param = required_param
+
+        @property
+        def name(self) -> str:
+            return f"requires_{self.required_param}"
+
+        def compute(self, df: pd.DataFrame) -> pd.Series:
+            return df["close"]
+    ''')
+
 
 @pytest.fixture
 def temp_indicators_dir(tmp_path):
@@ -28,24 +166,8 @@ def test_discover_indicators_empty_directory(temp_indicators_dir):
 
 def test_discover_indicators_finds_valid_indicator(temp_indicators_dir):
     """Test discovering a valid indicator class."""
-    indicator_code = dedent('''
-        from vici_trade_sdk import Indicator
-        import pandas as pd
-
-        class WilliamsR(Indicator):
-            def __init__(self, period: int = 14):
-                self.period = period
-
-            @property
-            def name(self) -> str:
-                return f"williams_r_{self.period}"
-
-            def compute(self, df: pd.DataFrame) -> pd.Series:
-                return pd.Series([0] * len(df), index=df.index)
-    ''')
-
     indicator_file = temp_indicators_dir / "williams_r.py"
-    indicator_file.write_text(indicator_code)
+    indicator_file.write_text(_WILLIAMS_R_SRC)
 
     registry = discover_indicators(temp_indicators_dir)
 
@@ -55,29 +177,8 @@ def test_discover_indicators_finds_valid_indicator(temp_indicators_dir):
 
 def test_discover_indicators_multiple_classes(temp_indicators_dir):
     """Test discovering multiple indicator classes in one file."""
-    indicator_code = dedent('''
-        from vici_trade_sdk import Indicator
-        import pandas as pd
-
-        class IndicatorOne(Indicator):
-            @property
-            def name(self) -> str:
-                return "indicator_one"
-
-            def compute(self, df: pd.DataFrame) -> pd.Series:
-                return df["close"]
-
-        class IndicatorTwo(Indicator):
-            @property
-            def name(self) -> str:
-                return "indicator_two"
-
-            def compute(self, df: pd.DataFrame) -> pd.Series:
-                return df["close"]
-    ''')
-
     indicator_file = temp_indicators_dir / "indicators.py"
-    indicator_file.write_text(indicator_code)
+    indicator_file.write_text(_TWO_INDICATORS_SRC)
 
     registry = discover_indicators(temp_indicators_dir)
 
@@ -87,21 +188,8 @@ def test_discover_indicators_multiple_classes(temp_indicators_dir):
 
 def test_discover_indicators_ignores_base_class(temp_indicators_dir):
     """Test that the Indicator base class itself is not included."""
-    indicator_code = dedent('''
-        from vici_trade_sdk import Indicator
-        import pandas as pd
-
-        class MyIndicator(Indicator):
-            @property
-            def name(self) -> str:
-                return "my_indicator"
-
-            def compute(self, df: pd.DataFrame) -> pd.Series:
-                return df["close"]
-    ''')
-
     indicator_file = temp_indicators_dir / "test.py"
-    indicator_file.write_text(indicator_code)
+    indicator_file.write_text(_MY_INDICATOR_SRC)
 
     registry = discover_indicators(temp_indicators_dir)
 
@@ -111,21 +199,8 @@ def test_discover_indicators_ignores_base_class(temp_indicators_dir):
 
 def test_discover_indicators_ignores_private_files(temp_indicators_dir):
     """Test that files starting with _ are ignored."""
-    indicator_code = dedent('''
-        from vici_trade_sdk import Indicator
-        import pandas as pd
-
-        class PrivateIndicator(Indicator):
-            @property
-            def name(self) -> str:
-                return "private"
-
-            def compute(self, df: pd.DataFrame) -> pd.Series:
-                return df["close"]
-    ''')
-
     private_file = temp_indicators_dir / "_private.py"
-    private_file.write_text(indicator_code)
+    private_file.write_text(_PRIVATE_INDICATOR_SRC)
 
     registry = discover_indicators(temp_indicators_dir)
 
@@ -156,23 +231,51 @@ def test_discover_indicators_handles_import_error(temp_indicators_dir):
     assert registry == {}
 
 
-def test_get_indicator_class_found(temp_indicators_dir):
-    """Test retrieving an indicator class by name."""
-    indicator_code = dedent('''
-        from vici_trade_sdk import Indicator
-        import pandas as pd
+def test_discover_indicators_reuses_unchanged_files(temp_indicators_dir):
+    """Test that an unchanged file is not re-executed on the next scan."""
+    indicator_file = temp_indicators_dir / "cached.py"
+    indicator_file.write_text(_CACHED_SRC)
 
-        class TestIndicator(Indicator):
-            @property
-            def name(self) -> str:
-                return "test"
+    first = discover_indicators(temp_indicators_dir)
+    second = discover_indicators(temp_indicators_dir)
+    assert second["Cached"] is first["Cached"]
 
-            def compute(self, df: pd.DataFrame) -> pd.Series:
-                return df["close"]
-    ''')
+    indicator_file.write_text(_CACHED_SRC.replace('"cached"', '"cached_v2"'))
+    third = discover_indicators(temp_indicators_dir)
+    assert third["Cached"] is not first["Cached"]
+    assert third["Cached"]().name == "cached_v2"
+
+
+def test_clear_indicator_cache_forces_reload(temp_indicators_dir):
+    """Test that clearing the cache re-executes a rewrite the stamp misses."""
+    indicator_file = temp_indicators_dir / "cached.py"
+    indicator_file.write_text(_CACHED_SRC)
+    first = discover_indicators(temp_indicators_dir)
 
+    # Same size, same mtime: the stamp cannot tell the files apart
+    stat = indicator_file.stat()
+    indicator_file.write_text(_CACHED_SRC.replace('"cached"', '"cachex"'))
+    os.utime(indicator_file, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+    assert discover_indicators(temp_indicators_dir)["Cached"] is first["Cached"]
+
+    clear_indicator_cache()
+    assert discover_indicators(temp_indicators_dir)["Cached"]().name == "cachex"
+
+
+def test_discover_indicators_forgets_deleted_files(temp_indicators_dir):
+    """Test that deleted files drop out of the registry."""
+    indicator_file = temp_indicators_dir / "gone.py"
+    indicator_file.write_text(_GONE_SRC)
+    assert "Gone" in discover_indicators(temp_indicators_dir)
+
+    indicator_file.unlink()
+    assert discover_indicators(temp_indicators_dir) == {}
+
+
+def test_get_indicator_class_found(temp_indicators_dir):
+    """Test retrieving an indicator class by name."""
     indicator_file = temp_indicators_dir / "test.py"
-    indicator_file.write_text(indicator_code)
+    indicator_file.write_text(_TEST_INDICATOR_SRC)
 
     indicator_cls = get_indicator_class("TestIndicator", temp_indicators_dir)
 
@@ -188,23 +291,8 @@ def test_get_indicator_class_not_found(temp_indicators_dir):
 
 def test_list_indicator_info(temp_indicators_dir):
     """Test listing indicator metadata."""
-    indicator_code = dedent('''
-        from vici_trade_sdk import Indicator
-        import pandas as pd
-
-        class DocumentedIndicator(Indicator):
-            """This is a well-documented indicator."""
-
-            @property
-            def name(self) -> str:
-                return "documented"
-
-            def compute(self, df: pd.DataFrame) -> pd.Series:
-                return df["close"]
-    ''')
-
     indicator_file = temp_indicators_dir / "documented.py"
-    indicator_file.write_text(indicator_code)
+    indicator_file.write_text(_DOCUMENTED_INDICATOR_SRC)
 
     info_list = list_indicator_info(temp_indicators_dir)
 
@@ -216,26 +304,8 @@ def test_list_indicator_info(temp_indicators_dir):
 
 def test_list_indicator_info_handles_instantiation_failure(temp_indicators_dir):
     """Test listing indicators that require constructor arguments."""
-    indicator_code = dedent('''
-        from vici_trade_sdk import Indicator
-        import pandas as pd
-
-        class RequiresArgs(Indicator):
-            """Requires constructor arguments."""
-
-            def __init__(self, required_param: int):
-                self.required_param = required_param
-
-            @property
-            def name(self) -> str:
-                return f"requires_{self.required_param}"
-
-            def compute(self, df: pd.DataFrame) -> pd.Series:
-                return df["close"]
-    ''')
-
     indicator_file = temp_indicators_dir / "requires_args.py"
-    indicator_file.write_text(indicator_code)
+    indicator_file.write_text(_REQUIRES_ARGS_SRC)
 
     info_list = list_indicator_info(temp_indicators_dir)
 
@@ -243,3 +313,31 @@ def test_list_indicator_info_handles_instantiation_failure(temp_indicators_dir):
     assert len(info_list) == 1
     assert info_list[0]["class_name"] == "RequiresArgs"
     assert info_list[0]["name"] == "RequiresArgs"  # Fallback to class name
+
+
+def test_discover_indicators_is_thread_safe(tmp_path):
+    """Test that concurrent scans do not trip over the shared module cache."""
+    directories = []
+    for i in range(8):
+        directory = tmp_path / f"indicators_{i}"
+        directory.mkdir()
+        for j in range(20):
+            (directory / f"ind_{j}.py").write_text(_GONE_SRC.replace("Gone", f"Gone{j}"))
+        directories.append(directory)
+
+    def scan(directory):
+        for _ in range(20):
+            discover_indicators(directory)
+            (directory / "ind_0.py").touch()
+        return discover_indicators(directory)
+
+    # Switch threads as often as possible so unguarded cache access races
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    try:
+        with ThreadPoolExecutor(max_workers=len(directories)) as pool:
+            registries = list(pool.map(scan, directories))
+    finally:
+        sys.setswitchinterval(interval)
+
+    assert all(len(registry) == 20 for registry in registries)
@@ -15,26 +15,19 @@ from app.services.workspace import (
 )
 
 
-@pytest.fixture
-def temp_workspace(monkeypatch, tmp_path):
-    """Create a temporary workspace for testing."""
-    monkeypatch.setenv("HOME", str(tmp_path))
-    yield tmp_path / ".vici-backtest"
-
-
-def test_get_workspace_dir(temp_workspace):
+def test_get_workspace_dir(tmp_home):
     """Test getting the workspace directory path."""
     workspace = get_workspace_dir()
-    assert workspace == temp_workspace
+    assert workspace == tmp_home / ".vici-backtest"
 
 
-def test_get_indicators_dir(temp_workspace):
+def test_get_indicators_dir(tmp_home):
     """Test getting the indicators directory path."""
     indicators_dir = get_indicators_dir()
-    assert indicators_dir == temp_workspace / "indicators"
+    assert indicators_dir == tmp_home / ".vici-backtest" / "indicators"
 
 
-def test_write_indicator_file(temp_workspace):
+def test_write_indicator_file(tmp_home):
     """Test writing an indicator file creates the file with correct content."""
     content = "from vici_trade_sdk import Indicator\n\nclass TestIndicator(Indicator):\n    pass"
     file_path = write_indicator_file("test.py", content)
@@ -43,7 +36,7 @@ def test_write_indicator_file(temp_workspace):
     assert file_path.read_text(encoding="utf-8") == content
 
 
-def test_write_indicator_file_creates_workspace(temp_workspace):
+def test_write_indicator_file_creates_workspace(tmp_home):
     """Test that write_indicator_file creates the workspace directory if missing."""
     indicators_dir = get_indicators_dir()
     assert not indicators_dir.exists()
@@ -69,8 +62,11 @@ def test_write_indicator_file_path_traversal():
     with pytest.raises(ValueError, match="path traversal"):
         write_indicator_file("..\\test.py", "content")
 
+    with pytest.raises(ValueError, match="path traversal"):
+        write_indicator_file("test\x00.py", "content")
+
 
-def test_read_indicator_file(temp_workspace):
+def test_read_indicator_file(tmp_home):
     """Test reading an indicator file returns its content."""
     content = "from vici_trade_sdk import Indicator"
     write_indicator_file("test.py", content)
@@ -91,37 +87,47 @@ def test_read_indicator_file_path_traversal():
         read_indicator_file("../test.py")
 
 
-def test_list_indicator_files(temp_workspace):
+def test_list_indicator_files(tmp_home):
     """Test listing indicator files returns all .py files."""
     write_indicator_file("indicator1.py", "# indicator 1")
     write_indicator_file("indicator2.py", "# indicator 2")
 
     files = list_indicator_files()
-    filenames = [f.name for f in files]
+    filenames = {f.name for f in files}
 
     assert "indicator1.py" in filenames
     assert "indicator2.py" in filenames
 
 
-def test_list_indicator_files_empty(temp_workspace):
+def test_list_indicator_files_empty(tmp_home):
     """Test listing files in empty directory returns empty list."""
     files = list_indicator_files()
     assert files == []
 
 
-def test_list_indicator_files_excludes_private(temp_workspace):
+def test_list_indicator_files_excludes_private(tmp_home):
     """Test that files starting with _ are excluded."""
     write_indicator_file("public.py", "# public")
     write_indicator_file("_private.py", "# private")
 
     files = list_indicator_files()
-    filenames = [f.name for f in files]
+    filenames = {f.name for f in files}
 
     assert "public.py" in filenames
     assert "_private.py" not in filenames
 
 
-def test_delete_indicator_file(temp_workspace):
+def test_list_indicator_files_skips_non_files(tmp_home):
+    """Test that directories and non-.py files are not listed."""
+    write_indicator_file("real.py", "# real")
+    (get_indicators_dir() / "package.py").mkdir()
+    (get_indicators_dir() / "notes.txt").write_text("notes")
+
+    files = list_indicator_files()
+    assert [f.name for f in files] == ["real.py"]
+
+
+def test_delete_indicator_file(tmp_home):
     """Test deleting an indicator file removes it from disk."""
     write_indicator_file("test.py", "# content")
     indicators_dir = get_indicators_dir()
@@ -144,7 +150,7 @@ def test_delete_indicator_file_path_traversal():
         delete_indicator_file("../test.py")
 
 
-def test_rename_indicator_file(temp_workspace):
+def test_rename_indicator_file(tmp_home):
     """Test renaming an indicator file."""
     write_indicator_file("old.py", "# content")
     new_path = rename_indicator_file("old.py", "new.py")
@@ -161,7 +167,7 @@ def test_rename_indicator_file_not_found():
         rename_indicator_file("nonexistent.py", "new.py")
 
 
-def test_rename_indicator_file_already_exists(temp_workspace):
+def test_rename_indicator_file_already_exists(tmp_home):
     """Test renaming to an existing filename raises FileExistsError."""
     write_indicator_file("old.py", "# old")
     write_indicator_file("new.py", "# new")
@@ -170,7 +176,7 @@ def test_rename_indicator_file_already_exists(temp_workspace):
         rename_indicator_file("old.py", "new.py")
 
 
-def test_rename_indicator_file_invalid_extension():
+def test_rename_indicator_file_invalid_extension(tmp_home):
     """Test renaming to a file without .py extension raises ValueError."""
     write_indicator_file("test.py", "# content")
 
@@ -184,7 +190,7 @@ def test_rename_indicator_file_path_traversal_old():
         rename_indicator_file("../old.py", "new.py")
 
 
-def test_rename_indicator_file_path_traversal_new():
+def test_rename_indicator_file_path_traversal_new(tmp_home):
     """Test that path traversal in new filename is rejected."""
     write_indicator_file("old.py", "# content")
 
@@ -192,7 +198,7 @@ def test_rename_indicator_file_path_traversal_new():
         rename_indicator_file("old.py", "../new.py")
 
 
-def test_get_indicator_file_path(temp_workspace):
+def test_get_indicator_file_path(tmp_home):
     """Test getting the full path to an indicator file."""
     indicators_dir = get_indicators_dir()
     file_path = get_indicator_file_path("test.py")
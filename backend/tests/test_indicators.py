@@ -18,9 +18,9 @@ from app.services.indicators import (
 )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def price_series():
-    """Simple ascending price series for indicator testing."""
+    """Simple ascending price series for indicator testing (shared, read-only)."""
     return pd.Series(
         [100, 102, 101, 103, 105, 104, 106, 108, 107, 109,
          110, 112, 111, 113, 115, 114, 116, 118, 117, 119],
@@ -28,18 +28,20 @@ def price_series():
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def ohlcv_df():
-    """OHLCV DataFrame for indicators that need full data."""
-    np.random.seed(42)
+    """OHLCV DataFrame for indicators that need full data (shared, read-only)."""
+    rng = np.random.default_rng(42)
     n = 50
-    close = 100 + np.cumsum(np.random.randn(n))
+    # Columns: close walk, open offset, high offset, low offset
+    noise = rng.standard_normal((n, 4))
+    close = 100 + np.cumsum(noise[:, 0])
     return pd.DataFrame({
-        "open": close - np.random.rand(n) * 0.5,
-        "high": close + np.abs(np.random.randn(n)) * 0.5,
-        "low": close - np.abs(np.random.randn(n)) * 0.5,
+        "open": close - np.abs(noise[:, 1]) * 0.5,
+        "high": close + np.abs(noise[:, 2]) * 0.5,
+        "low": close - np.abs(noise[:, 3]) * 0.5,
         "close": close,
-        "volume": np.random.randint(100000, 1000000, n),
+        "volume": rng.integers(100_000, 1_000_000, size=n, dtype=np.int64),
     })
 
 
@@ -58,6 +60,22 @@ class TestSMA:
         result = sma(series, period=5)
         assert all(result.dropna() == 50.0)
 
+    def test_sma_matches_rolling_mean(self, ohlcv_df):
+        result = sma(ohlcv_df["close"], period=10)
+        expected = ohlcv_df["close"].rolling(window=10, min_periods=10).mean()
+        pd.testing.assert_series_equal(result, expected, check_exact=True)
+
+    def test_sma_with_nan_input(self):
+        series = pd.Series([1.0, 2.0, np.nan, 4.0, 5.0, 6.0, 7.0])
+        result = sma(series, period=2)
+        expected = series.rolling(window=2, min_periods=2).mean()
+        pd.testing.assert_series_equal(result, expected)
+
+    def test_sma_period_longer_than_series(self, price_series):
+        result = sma(price_series, period=len(price_series) + 5)
+        assert len(result) == len(price_series)
+        assert result.isna().all()
+
 
 class TestEMA:
     def test_ema_length(self, price_series):
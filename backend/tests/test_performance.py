@@ -1,9 +1,11 @@
 """Tests for the Performance Calculator."""
 
+import numpy as np
 
 from app.services.performance import (
     _annualized_return,
     _consecutive_streaks,
+    _equity_array,
     _max_drawdown,
     _sharpe_ratio,
     _trade_statistics,
@@ -33,34 +35,36 @@ def _make_trade(symbol, side, qty, price, commission=0, date="2024-01-01"):
 
 class TestMaxDrawdown:
     def test_no_drawdown(self):
-        curve = [{"equity": 100}, {"equity": 110}, {"equity": 120}]
-        assert _max_drawdown(curve) == 0.0
+        assert _max_drawdown(np.array([100.0, 110.0, 120.0])) == 0.0
 
     def test_simple_drawdown(self):
-        curve = [
-            {"equity": 100}, {"equity": 120},
-            {"equity": 90}, {"equity": 110},
-        ]
-        dd = _max_drawdown(curve)
+        dd = _max_drawdown(np.array([100.0, 120.0, 90.0, 110.0]))
         # Peak was 120, trough was 90 => -25%
         assert abs(dd - (-25.0)) < 0.01
 
     def test_empty_curve(self):
-        assert _max_drawdown([]) == 0.0
+        assert _max_drawdown(np.array([])) == 0.0
 
 
 class TestSharpeRatio:
     def test_zero_std_returns_zero(self):
-        curve = [{"equity": 100}] * 10
-        assert _sharpe_ratio(curve) == 0.0
+        assert _sharpe_ratio(np.full(10, 100.0)) == 0.0
 
     def test_positive_sharpe_for_uptrend(self):
-        curve = [{"equity": 100 + i} for i in range(100)]
-        sharpe = _sharpe_ratio(curve)
+        sharpe = _sharpe_ratio(100.0 + np.arange(100))
         assert sharpe > 0
 
     def test_short_curve(self):
-        assert _sharpe_ratio([{"equity": 100}]) == 0.0
+        assert _sharpe_ratio(np.array([100.0])) == 0.0
+        assert _sharpe_ratio(np.array([100.0, 101.0])) == 0.0
+
+
+class TestEquityArray:
+    def test_extracts_equity_in_order(self):
+        curve = [{"date": "2024-01-01", "equity": 100}, {"date": "2024-01-02", "equity": 105.5}]
+        result = _equity_array(curve)
+        assert result.dtype == np.float64
+        assert result.tolist() == [100.0, 105.5]
 
 
 class TestAnnualizedReturn:
@@ -106,6 +110,30 @@ class TestTradeStatistics:
         assert stats["losing_trades"] == 1
         assert stats["win_rate"] == 50.0
 
+    def test_trailing_open_buy_is_ignored(self):
+        trades = [
+            _make_trade("AAPL", Side.BUY, 10, 100, 0, "2024-01-01"),
+            _make_trade("AAPL", Side.SELL, 10, 110, 0, "2024-01-05"),
+            _make_trade("AAPL", Side.BUY, 10, 120, 0, "2024-01-10"),
+        ]
+        stats = _trade_statistics(trades)
+        assert stats["total_trades"] == 1
+        assert abs(stats["avg_trade_return_pct"] - 10.0) < 1e-9
+
+    def test_interleaved_symbols_pair_fifo_per_symbol(self):
+        trades = [
+            _make_trade("AAPL", Side.BUY, 10, 100, 0, "2024-01-01"),
+            _make_trade("MSFT", Side.BUY, 10, 200, 0, "2024-01-01"),
+            _make_trade("AAPL", Side.BUY, 10, 150, 0, "2024-01-02"),
+            _make_trade("MSFT", Side.SELL, 10, 180, 0, "2024-01-03"),
+            _make_trade("AAPL", Side.SELL, 10, 110, 0, "2024-01-04"),
+        ]
+        stats = _trade_statistics(trades)
+        # MSFT 200 -> 180 loses; AAPL closes the oldest buy (100 -> 110) and wins
+        assert stats["total_trades"] == 2
+        assert stats["winning_trades"] == 1
+        assert stats["losing_trades"] == 1
+
 
 class TestConsecutiveStreaks:
     def test_all_wins(self):
@@ -123,6 +151,14 @@ class TestConsecutiveStreaks:
         assert wins == 1
         assert losses == 1
 
+    def test_longest_runs_and_zero_counts_as_loss(self):
+        wins, losses = _consecutive_streaks([1.0, 2.0, -1.0, 0.0, -3.0, 4.0, 5.0, 6.0, -1.0])
+        assert wins == 3
+        assert losses == 3
+
+    def test_empty(self):
+        assert _consecutive_streaks([]) == (0, 0)
+
 
 class TestCalculatePerformance:
     def test_empty_portfolio(self):
@@ -47,6 +47,15 @@ class TestPortfolio:
         assert trade is None
         assert portfolio.cash == 1000
 
+    @pytest.mark.parametrize("quantity", [0, -5])
+    def test_buy_non_positive_quantity(self, quantity):
+        portfolio = Portfolio(initial_capital=100_000, commission_rate=0.001)
+        trade = portfolio.buy("AAPL", quantity, 150.0, "2024-01-02")
+        assert trade is None
+        assert portfolio.cash == 100_000
+        assert not portfolio.get_position("AAPL").is_open
+        assert portfolio.trades == []
+
     def test_sell_success(self):
         portfolio = Portfolio(initial_capital=100_000, commission_rate=0.001)
         portfolio.buy("AAPL", 10, 150.0, "2024-01-02")
@@ -64,6 +73,17 @@ class TestPortfolio:
         trade = portfolio.sell("AAPL", 10, 160.0, "2024-01-03")
         assert trade is None
 
+    @pytest.mark.parametrize("quantity", [0, -5])
+    def test_sell_non_positive_quantity(self, quantity):
+        portfolio = Portfolio(initial_capital=100_000, commission_rate=0.001)
+        portfolio.buy("AAPL", 10, 150.0, "2024-01-02")
+        cash = portfolio.cash
+        trade = portfolio.sell("AAPL", quantity, 160.0, "2024-01-03")
+        assert trade is None
+        assert portfolio.cash == cash
+        assert portfolio.get_position("AAPL").quantity == 10
+        assert len(portfolio.trades) == 1
+
     def test_partial_sell(self):
         portfolio = Portfolio(initial_capital=100_000, commission_rate=0.001)
         portfolio.buy("AAPL", 20, 150.0, "2024-01-02")
@@ -79,6 +99,50 @@ class TestPortfolio:
         # cash: 100000 - 1500 = 98500, position: 10 * 160 = 1600
         assert equity == pytest.approx(100_100)
 
+    def test_total_equity_skips_closed_positions(self):
+        portfolio = Portfolio(initial_capital=100_000, commission_rate=0)
+        portfolio.buy("AAPL", 10, 150.0, "2024-01-02")
+        portfolio.buy("GOOGL", 5, 100.0, "2024-01-02")
+        portfolio.sell("AAPL", 10, 160.0, "2024-01-03")
+        equity = portfolio.total_equity({"AAPL": 170.0, "GOOGL": 110.0})
+        # cash: 100000 - 1500 - 500 + 1600 = 99600, GOOGL: 5 * 110 = 550
+        assert equity == pytest.approx(100_150)
+
+    def test_open_positions_track_positions(self):
+        portfolio = Portfolio(initial_capital=100_000, commission_rate=0.001)
+        portfolio.get_position("MSFT")
+        portfolio.buy("AAPL", 20, 150.0, "2024-01-02")
+        portfolio.buy("GOOGL", 5, 100.0, "2024-01-02")
+        portfolio.sell("AAPL", 10, 160.0, "2024-01-03")
+        portfolio.sell("GOOGL", 5, 110.0, "2024-01-03")
+        portfolio.buy("GOOGL", 2, 105.0, "2024-01-04")
+        portfolio.sell("AAPL", 10, 155.0, "2024-01-05")
+
+        expected = {s: p for s, p in portfolio.positions.items() if p.is_open}
+        assert portfolio._open_positions == expected
+        assert all(portfolio._open_positions[s] is p for s, p in expected.items())
+        assert list(expected) == ["GOOGL"]
+
+    def test_total_equity_counts_positions_passed_in(self):
+        positions = {
+            "AAPL": Position(symbol="AAPL", quantity=10, avg_price=150.0, cost_basis=1500.0),
+            "MSFT": Position(symbol="MSFT"),
+        }
+        portfolio = Portfolio(initial_capital=100_000, commission_rate=0, positions=positions)
+        assert portfolio.total_equity({"AAPL": 160.0, "MSFT": 300.0}) == pytest.approx(101_600)
+
+    def test_total_equity_ignores_position_opened_directly(self):
+        # Documented contract: positions are opened through buy() only
+        portfolio = Portfolio(initial_capital=100_000, commission_rate=0)
+        portfolio.get_position("AAPL").quantity = 10
+        assert portfolio.total_equity({"AAPL": 160.0}) == pytest.approx(100_000)
+
+    def test_total_equity_ignores_position_closed_directly(self):
+        portfolio = Portfolio(initial_capital=100_000, commission_rate=0)
+        portfolio.buy("AAPL", 10, 150.0, "2024-01-02")
+        portfolio.get_position("AAPL").quantity = 0.0
+        assert portfolio.total_equity({"AAPL": 160.0}) == pytest.approx(98_500)
+
     def test_record_equity(self):
         portfolio = Portfolio(initial_capital=100_000, commission_rate=0)
         portfolio.record_equity("2024-01-02", {})
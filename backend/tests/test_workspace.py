@@ -1,8 +1,5 @@
 """Tests for workspace management."""
 
-import shutil
-from pathlib import Path
-
 import pytest
 
 from app.services.workspace import (
@@ -18,30 +15,19 @@ from app.services.workspace import (
 )
 
 
-@pytest.fixture
-def clean_workspace():
-    """Clean up test workspace before and after tests."""
-    workspace = get_workspace_dir()
-    if workspace.exists():
-        shutil.rmtree(workspace)
-    yield
-    if workspace.exists():
-        shutil.rmtree(workspace)
-
-
-def test_get_workspace_dir():
+def test_get_workspace_dir(workspace_home):
     """Test getting workspace directory path."""
     workspace = get_workspace_dir()
-    assert workspace == Path.home() / ".vici-backtest"
+    assert workspace == workspace_home / ".vici-backtest"
 
 
-def test_get_strategies_dir():
+def test_get_strategies_dir(workspace_home):
     """Test getting strategies directory path."""
     strategies = get_strategies_dir()
-    assert strategies == Path.home() / ".vici-backtest" / "strategies"
+    assert strategies == workspace_home / ".vici-backtest" / "strategies"
 
 
-def test_ensure_workspace_exists(clean_workspace):
+def test_ensure_workspace_exists(tmp_home):
     """Test workspace directory creation."""
     ensure_workspace_exists()
 
@@ -54,7 +40,7 @@ def test_ensure_workspace_exists(clean_workspace):
     assert strategies.is_dir()
 
 
-def test_write_strategy_file(clean_workspace):
+def test_write_strategy_file(tmp_home):
     """Test writing a strategy file."""
     filename = "test_strategy.py"
     content = "# Test strategy"
@@ -66,7 +52,7 @@ def test_write_strategy_file(clean_workspace):
     assert path.read_text() == content
 
 
-def test_write_strategy_file_creates_workspace(clean_workspace):
+def test_write_strategy_file_creates_workspace(tmp_home):
     """Test that writing creates workspace if it doesn't exist."""
     assert not get_workspace_dir().exists()
 
@@ -76,13 +62,13 @@ def test_write_strategy_file_creates_workspace(clean_workspace):
     assert get_strategies_dir().exists()
 
 
-def test_write_strategy_file_invalid_extension(clean_workspace):
+def test_write_strategy_file_invalid_extension(tmp_home):
     """Test writing file without .py extension fails."""
     with pytest.raises(ValueError, match="must end with .py"):
         write_strategy_file("invalid.txt", "content")
 
 
-def test_write_strategy_file_path_traversal(clean_workspace):
+def test_write_strategy_file_path_traversal(tmp_home):
     """Test that path traversal is blocked."""
     with pytest.raises(ValueError, match="cannot contain path traversal"):
         write_strategy_file("../evil.py", "content")
@@ -91,7 +77,7 @@ def test_write_strategy_file_path_traversal(clean_workspace):
         write_strategy_file("subdir/file.py", "content")
 
 
-def test_read_strategy_file(clean_workspace):
+def test_read_strategy_file(tmp_home):
     """Test reading a strategy file."""
     filename = "read_test.py"
     content = "# Read test content"
@@ -102,19 +88,19 @@ def test_read_strategy_file(clean_workspace):
     assert read_content == content
 
 
-def test_read_nonexistent_file(clean_workspace):
+def test_read_nonexistent_file(tmp_home):
     """Test reading nonexistent file raises error."""
     with pytest.raises(FileNotFoundError, match="Strategy file not found"):
         read_strategy_file("nonexistent.py")
 
 
-def test_read_strategy_file_path_traversal(clean_workspace):
+def test_read_strategy_file_path_traversal(tmp_home):
     """Test that path traversal is blocked for reading."""
     with pytest.raises(ValueError, match="cannot contain path traversal"):
         read_strategy_file("../evil.py")
 
 
-def test_list_strategy_files(clean_workspace):
+def test_list_strategy_files(tmp_home):
     """Test listing strategy files."""
     write_strategy_file("strategy1.py", "# Strategy 1")
     write_strategy_file("strategy2.py", "# Strategy 2")
@@ -123,19 +109,29 @@ def test_list_strategy_files(clean_workspace):
     files = list_strategy_files()
 
     assert len(files) == 2
-    filenames = [f.name for f in files]
+    filenames = {f.name for f in files}
     assert "strategy1.py" in filenames
     assert "strategy2.py" in filenames
     assert "_private.py" not in filenames
 
 
-def test_list_strategy_files_empty(clean_workspace):
+def test_list_strategy_files_empty(tmp_home):
     """Test listing files when directory doesn't exist."""
     files = list_strategy_files()
     assert files == []
 
 
-def test_delete_strategy_file(clean_workspace):
+def test_list_strategy_files_skips_non_files(tmp_home):
+    """Test that directories and non-.py files are not listed."""
+    write_strategy_file("real.py", "# real")
+    (get_strategies_dir() / "package.py").mkdir()
+    (get_strategies_dir() / "notes.txt").write_text("notes")
+
+    files = list_strategy_files()
+    assert [f.name for f in files] == ["real.py"]
+
+
+def test_delete_strategy_file(tmp_home):
     """Test deleting a strategy file."""
     filename = "delete_test.py"
     write_strategy_file(filename, "# Delete test")
@@ -145,19 +141,19 @@ def test_delete_strategy_file(clean_workspace):
     assert not (get_strategies_dir() / filename).exists()
 
 
-def test_delete_nonexistent_file(clean_workspace):
+def test_delete_nonexistent_file(tmp_home):
     """Test deleting nonexistent file raises error."""
     with pytest.raises(FileNotFoundError, match="Strategy file not found"):
         delete_strategy_file("nonexistent.py")
 
 
-def test_delete_strategy_file_path_traversal(clean_workspace):
+def test_delete_strategy_file_path_traversal(tmp_home):
     """Test that path traversal is blocked for deletion."""
     with pytest.raises(ValueError, match="cannot contain path traversal"):
         delete_strategy_file("../evil.py")
 
 
-def test_initialize_workspace_with_examples(clean_workspace, tmp_path):
+def test_initialize_workspace_with_examples(tmp_home, tmp_path):
     """Test initializing workspace with example strategies."""
     # Create fake built-in strategies
     builtin_dir = tmp_path / "builtin_strategies"
@@ -177,7 +173,7 @@ def test_initialize_workspace_with_examples(clean_workspace, tmp_path):
     assert not (strategies_dir / "_private.py").exists()
 
 
-def test_initialize_workspace_skips_if_not_empty(clean_workspace, tmp_path):
+def test_initialize_workspace_skips_if_not_empty(tmp_home, tmp_path):
     """Test that initialization skips if workspace already has strategies."""
     # Create a strategy in workspace
     write_strategy_file("existing.py", "# Existing")
@@ -196,7 +192,7 @@ def test_initialize_workspace_skips_if_not_empty(clean_workspace, tmp_path):
     assert files[0].name == "existing.py"
 
 
-def test_initialize_workspace_handles_missing_builtin_dir(clean_workspace, tmp_path):
+def test_initialize_workspace_handles_missing_builtin_dir(tmp_home, tmp_path):
     """Test that initialization handles missing built-in directory gracefully."""
     nonexistent_dir = tmp_path / "nonexistent"
 
@@ -208,7 +204,7 @@ def test_initialize_workspace_handles_missing_builtin_dir(clean_workspace, tmp_p
     assert len(list_strategy_files()) == 0
 
 
-def test_rename_strategy_file(clean_workspace):
+def test_rename_strategy_file(tmp_home):
     """Test renaming a strategy file."""
     old_filename = "old_name.py"
     new_filename = "new_name.py"
@@ -227,13 +223,13 @@ def test_rename_strategy_file(clean_workspace):
     assert new_path.read_text() == content
 
 
-def test_rename_strategy_file_not_found(clean_workspace):
+def test_rename_strategy_file_not_found(tmp_home):
     """Test renaming nonexistent file raises error."""
     with pytest.raises(FileNotFoundError, match="Strategy file not found"):
         rename_strategy_file("nonexistent.py", "new_name.py")
 
 
-def test_rename_strategy_file_already_exists(clean_workspace):
+def test_rename_strategy_file_already_exists(tmp_home):
     """Test renaming to existing filename raises error."""
     write_strategy_file("file1.py", "# File 1")
     write_strategy_file("file2.py", "# File 2")
@@ -242,7 +238,7 @@ def test_rename_strategy_file_already_exists(clean_workspace):
         rename_strategy_file("file1.py", "file2.py")
 
 
-def test_rename_strategy_file_invalid_extension(clean_workspace):
+def test_rename_strategy_file_invalid_extension(tmp_home):
     """Test renaming to filename without .py extension fails."""
     write_strategy_file("test.py", "# Test")
 
@@ -250,7 +246,7 @@ def test_rename_strategy_file_invalid_extension(clean_workspace):
         rename_strategy_file("test.py", "test.txt")
 
 
-def test_rename_strategy_file_path_traversal_old(clean_workspace):
+def test_rename_strategy_file_path_traversal_old(tmp_home):
     """Test that path traversal is blocked for old filename."""
     with pytest.raises(ValueError, match="cannot contain path traversal"):
         rename_strategy_file("../evil.py", "new.py")
@@ -259,7 +255,7 @@ def test_rename_strategy_file_path_traversal_old(clean_workspace):
         rename_strategy_file("subdir/file.py", "new.py")
 
 
-def test_rename_strategy_file_path_traversal_new(clean_workspace):
+def test_rename_strategy_file_path_traversal_new(tmp_home):
     """Test that path traversal is blocked for new filename."""
     write_strategy_file("test.py", "# Test")
 
@@ -14,7 +14,7 @@ class Side(str, Enum):
     SELL = "SELL"
 
 
-@dataclass
+@dataclass(slots=True)
 class Trade:
     """Record of a single executed trade."""
 
@@ -26,7 +26,7 @@ class Trade:
     date: str
 
 
-@dataclass
+@dataclass(slots=True)
 class Position:
     """An open position in a single stock.
 
@@ -57,6 +57,11 @@ class Portfolio:
 
     This is the primary interface strategies use to place orders
     and check account state.
+
+    Positions must be opened through buy() and closed through sell().
+    total_equity() only walks the positions those calls (or the
+    ``positions`` passed in) left open, so a Position whose quantity is
+    raised from zero directly is not counted.
     """
 
     initial_capital: float
@@ -65,10 +70,18 @@ class Portfolio:
     positions: dict[str, Position] = field(default_factory=dict)
     trades: list[Trade] = field(default_factory=list)
     equity_history: list[dict] = field(default_factory=list)
+    # Subset of ``positions`` with shares held, kept in sync by buy/sell so
+    # total_equity does not have to walk flat positions every bar.
+    _open_positions: dict[str, Position] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
 
     def __post_init__(self):
         if self.cash == 0.0:
             self.cash = self.initial_capital
+        self._open_positions = {
+            symbol: position for symbol, position in self.positions.items() if position.is_open
+        }
 
     def get_position(self, symbol: str) -> Position:
         """Return the position for a symbol, creating one if needed.
@@ -94,8 +107,12 @@ class Portfolio:
             date: Date string of the trade.
 
         Returns:
-            Trade record if executed, None if insufficient cash.
+            Trade record if executed, None if the quantity is not positive
+            or cash is insufficient.
         """
+        if quantity <= 0:
+            return None
+
         cost = quantity * price
         commission = cost * self.commission_rate
         total_cost = cost + commission
@@ -110,6 +127,8 @@ class Portfolio:
         position.avg_price = new_cost_basis / new_quantity if new_quantity > 0 else 0
         position.quantity = new_quantity
         position.cost_basis = new_cost_basis
+        if position.is_open:
+            self._open_positions[symbol] = position
 
         trade = Trade(
             symbol=symbol, side=Side.BUY, quantity=quantity,
@@ -129,8 +148,12 @@ class Portfolio:
             date: Date string of the trade.
 
         Returns:
-            Trade record if executed, None if insufficient shares.
+            Trade record if executed, None if the quantity is not positive
+            or shares are insufficient.
         """
+        if quantity <= 0:
+            return None
+
         position = self.get_position(symbol)
         if quantity > position.quantity:
             return None
@@ -150,6 +173,7 @@ class Portfolio:
             position.quantity = 0.0
             position.cost_basis = 0.0
             position.avg_price = 0.0
+            self._open_positions.pop(symbol, None)
 
         trade = Trade(
             symbol=symbol, side=Side.SELL, quantity=quantity,
@@ -168,9 +192,10 @@ class Portfolio:
             Total equity value.
         """
         equity = self.cash
-        for symbol, position in self.positions.items():
-            if position.is_open and symbol in current_prices:
-                equity += position.market_value(current_prices[symbol])
+        for symbol, position in self._open_positions.items():
+            price = current_prices.get(symbol)
+            if price is not None and position.is_open:
+                equity += position.market_value(price)
         return equity
 
     def record_equity(self, date: str,